@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import asyncio
+import functools
+import importlib
 import logging
 from typing import Any
 
@@ -11,10 +14,12 @@ from .client import XScheduleClient
 from .coordinator import XScheduleCoordinator
 from .const import (
     CONF_HOST,
+    CONF_LISTS_REFRESH_SECS,
     CONF_PASSWORD,
     CONF_POLL_IDLE,
     CONF_POLL_PLAYING,
     CONF_PORT,
+    DEFAULT_LISTS_REFRESH_SECS,
     DEFAULT_POLL_IDLE,
     DEFAULT_POLL_PLAYING,
     DOMAIN,
@@ -34,21 +39,37 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     port = entry.data[CONF_PORT]
     password = entry.data.get(CONF_PASSWORD, "")
 
-    client = XScheduleClient(session, host, port, password)
-    coordinator = XScheduleCoordinator(hass, client, entry.options)
+    client = XScheduleClient(
+        session,
+        host,
+        port,
+        password,
+        steps_ttl=entry.options.get(CONF_LISTS_REFRESH_SECS, DEFAULT_LISTS_REFRESH_SECS),
+    )
+    coordinator = XScheduleCoordinator(hass, client, entry.options, entry.entry_id)
 
     await coordinator.async_config_entry_first_refresh()
 
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    domain_data[entry.entry_id] = {
         "client": client,
         "coordinator": coordinator,
+        # Shared device identifier / unique_id prefix for the entry's entities
+        "host_port": f"{host}:{port}",
     }
-
-    # Schedule platform setups to avoid blocking import warnings inside the event loop
-    hass.async_create_task(
-        hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # single instance for now – services act on the first loaded entry
+    domain_data.setdefault("_active", (client, coordinator))
+
+    # Import platform modules in the executor so the forward below only hits sys.modules
+    await asyncio.gather(
+        *(
+            hass.async_add_executor_job(importlib.import_module, f"{__name__}.{platform}")
+            for platform in PLATFORMS
+        )
     )
 
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
     _register_services(hass)
     return True
 
@@ -56,21 +77,26 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        domain_data = hass.data[DOMAIN]
+        entry_data = domain_data.pop(entry.entry_id, None) or {}
+        if domain_data.get("_active") == (entry_data.get("client"), entry_data.get("coordinator")):
+            domain_data.pop("_active", None)
+            # Hand services over to another loaded entry, if any remain
+            other = next(iter(domain_data.values()), None)
+            if other:
+                domain_data["_active"] = (other.get("client"), other.get("coordinator"))
     return unload_ok
 
 
 def _get_integration_objects(hass: HomeAssistant) -> tuple[XScheduleClient | None, XScheduleCoordinator | None]:
-    data = hass.data.get(DOMAIN) or {}
-    if not data:
-        return None, None
-    # single instance for now – just take the first
-    entry_id = next(iter(data))
-    entry_data = data[entry_id]
-    return entry_data.get("client"), entry_data.get("coordinator")
+    return hass.data.get(DOMAIN, {}).get("_active", (None, None))
 
 
 def _register_services(hass: HomeAssistant) -> None:
+    # Services are global to the domain; only register them for the first entry
+    if hass.services.has_service(DOMAIN, "play_playlist"):
+        return
+
     async def _service_wrapper(call, handler):
         client, coordinator = _get_integration_objects(hass)
         if not client:
@@ -112,7 +138,7 @@ def _register_services(hass: HomeAssistant) -> None:
         desired = bool(data.get("state", False))
         current = False
         if coordinator and coordinator.data:
-            current = coordinator.data.get("playlistlooping", "false") == "true"
+            current = bool(coordinator.data.get("playlistlooping_bool"))
         if desired != current:
             await client.toggle_playlist_loop()
 
@@ -123,7 +149,7 @@ def _register_services(hass: HomeAssistant) -> None:
         desired = bool(data.get("state", False))
         current = False
         if coordinator and coordinator.data:
-            current = coordinator.data.get("outputtolights", "false") == "true"
+            current = bool(coordinator.data.get("outputtolights_bool"))
         if desired != current:
             await client.toggle_output_to_lights()
 
@@ -141,16 +167,15 @@ def _register_services(hass: HomeAssistant) -> None:
         interval = data.get("interval")
         foreground = data.get("foreground")
         background = data.get("background")
-        parts = [str(mode)]
-        if model not in (None, ""):
-            parts.append(str(model))
+        params = str(mode)
+        if model:
+            params = f"{params}|{model}"
         if interval not in (None, ""):
-            parts.append(str(int(interval)))
+            params = f"{params}|{int(interval)}"
         if foreground not in (None, ""):
-            parts.append(str(int(foreground)))
+            params = f"{params}|{int(foreground)}"
         if background not in (None, ""):
-            parts.append(str(int(background)))
-        params = "|".join(parts)
+            params = f"{params}|{int(background)}"
         res = await client.command("Start test mode", parameters=params)
         if res.get("result") == "ok":
             hass.bus.async_fire(
@@ -172,15 +197,19 @@ def _register_services(hass: HomeAssistant) -> None:
             )
 
 
-    hass.services.async_register(DOMAIN, "play_playlist", lambda call: _service_wrapper(call, svc_play_playlist))
-    hass.services.async_register(DOMAIN, "stop_playlist", lambda call: _service_wrapper(call, svc_stop_playlist))
-    hass.services.async_register(DOMAIN, "play_step", lambda call: _service_wrapper(call, svc_play_step))
-    hass.services.async_register(DOMAIN, "seek_ms", lambda call: _service_wrapper(call, svc_seek_ms))
-    hass.services.async_register(DOMAIN, "toggle_playlist_loop", lambda call: _service_wrapper(call, svc_toggle_playlist_loop))
-    hass.services.async_register(DOMAIN, "set_playlist_loop", lambda call: _service_wrapper(call, svc_set_playlist_loop))
-    hass.services.async_register(DOMAIN, "toggle_output_to_lights", lambda call: _service_wrapper(call, svc_toggle_output))
-    hass.services.async_register(DOMAIN, "set_output_to_lights", lambda call: _service_wrapper(call, svc_set_output))
-    hass.services.async_register(DOMAIN, "set_volume", lambda call: _service_wrapper(call, svc_set_volume))
-    hass.services.async_register(DOMAIN, "adjust_volume", lambda call: _service_wrapper(call, svc_adjust_volume))
-    hass.services.async_register(DOMAIN, "start_test_mode", lambda call: _service_wrapper(call, svc_start_test_mode))
-    hass.services.async_register(DOMAIN, "stop_test_mode", lambda call: _service_wrapper(call, svc_stop_test_mode))
+    services = (
+        ("play_playlist", svc_play_playlist),
+        ("stop_playlist", svc_stop_playlist),
+        ("play_step", svc_play_step),
+        ("seek_ms", svc_seek_ms),
+        ("toggle_playlist_loop", svc_toggle_playlist_loop),
+        ("set_playlist_loop", svc_set_playlist_loop),
+        ("toggle_output_to_lights", svc_toggle_output),
+        ("set_output_to_lights", svc_set_output),
+        ("set_volume", svc_set_volume),
+        ("adjust_volume", svc_adjust_volume),
+        ("start_test_mode", svc_start_test_mode),
+        ("stop_test_mode", svc_stop_test_mode),
+    )
+    for name, handler in services:
+        hass.services.async_register(DOMAIN, name, functools.partial(_service_wrapper, handler=handler))
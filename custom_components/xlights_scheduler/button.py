@@ -5,11 +5,11 @@ from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .client import XScheduleClient
 from .coordinator import XScheduleCoordinator
-from .const import DOMAIN, INTEGRATION_VERSION, slugify_entry_title
+from .entity import XScheduleEntity
+from .const import DOMAIN, slugify_entry_title
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -18,34 +18,23 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     data = hass.data[DOMAIN][entry.entry_id]
     client: XScheduleClient = data["client"]
     coordinator: XScheduleCoordinator = data["coordinator"]
+    host_port: str = data["host_port"]
 
     async_add_entities(
         [
-            NextStepButton(client, coordinator, entry),
-            PriorStepButton(client, coordinator, entry),
-            RestartStepButton(client, coordinator, entry),
-            StopAllNowButton(client, coordinator, entry),
-            CloseXScheduleButton(client, coordinator, entry),
+            NextStepButton(client, coordinator, entry, host_port),
+            PriorStepButton(client, coordinator, entry, host_port),
+            RestartStepButton(client, coordinator, entry, host_port),
+            StopAllNowButton(client, coordinator, entry, host_port),
+            CloseXScheduleButton(client, coordinator, entry, host_port),
         ]
     )
 
 
-class BaseXScheduleButton(CoordinatorEntity[XScheduleCoordinator], ButtonEntity):
-    def __init__(self, client: XScheduleClient, coordinator: XScheduleCoordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator)
-        self._client = client
-        self._entry = entry
-
-    @property
-    def device_info(self):
-        xs_ver = (self.coordinator.data or {}).get("version") if self.coordinator else None
-        return {
-            "identifiers": {(DOMAIN, f"{self._entry.data['host']}:{self._entry.data['port']}")},
-            "name": "xLights Scheduler",
-            "manufacturer": "xLights",
-            "model": "xSchedule",
-            "sw_version": xs_ver or INTEGRATION_VERSION,
-        }
+class BaseXScheduleButton(XScheduleEntity, ButtonEntity):
+    def __init__(self, client: XScheduleClient, coordinator: XScheduleCoordinator, entry: ConfigEntry, host_port: str) -> None:
+        super().__init__(client, coordinator, entry, host_port)
+        self._device_slug = slugify_entry_title(entry)
 
 
 class NextStepButton(BaseXScheduleButton):
@@ -53,14 +42,10 @@ class NextStepButton(BaseXScheduleButton):
     _attr_translation_key = "next_step"
     _attr_icon = "mdi:skip-next"
 
-    def __init__(self, client: XScheduleClient, coordinator: XScheduleCoordinator, entry: ConfigEntry) -> None:
-        super().__init__(client, coordinator, entry)
-        device_slug = slugify_entry_title(entry)
-        self.entity_id = f"button.{DOMAIN}_{device_slug}_next_step"
-
-    @property
-    def unique_id(self) -> str:
-        return f"{self._entry.data['host']}:{self._entry.data['port']}:button_next"
+    def __init__(self, client: XScheduleClient, coordinator: XScheduleCoordinator, entry: ConfigEntry, host_port: str) -> None:
+        super().__init__(client, coordinator, entry, host_port)
+        self._attr_unique_id = f"{host_port}:button_next"
+        self.entity_id = f"button.{DOMAIN}_{self._device_slug}_next_step"
 
     async def async_press(self) -> None:
         await self._client.next_step()
@@ -72,14 +57,10 @@ class PriorStepButton(BaseXScheduleButton):
     _attr_translation_key = "prior_step"
     _attr_icon = "mdi:skip-previous"
 
-    def __init__(self, client: XScheduleClient, coordinator: XScheduleCoordinator, entry: ConfigEntry) -> None:
-        super().__init__(client, coordinator, entry)
-        device_slug = slugify_entry_title(entry)
-        self.entity_id = f"button.{DOMAIN}_{device_slug}_prior_step"
-
-    @property
-    def unique_id(self) -> str:
-        return f"{self._entry.data['host']}:{self._entry.data['port']}:button_prior"
+    def __init__(self, client: XScheduleClient, coordinator: XScheduleCoordinator, entry: ConfigEntry, host_port: str) -> None:
+        super().__init__(client, coordinator, entry, host_port)
+        self._attr_unique_id = f"{host_port}:button_prior"
+        self.entity_id = f"button.{DOMAIN}_{self._device_slug}_prior_step"
 
     async def async_press(self) -> None:
         await self._client.prior_step()
@@ -91,14 +72,10 @@ class RestartStepButton(BaseXScheduleButton):
     _attr_translation_key = "restart_step"
     _attr_icon = "mdi:restart"
 
-    def __init__(self, client: XScheduleClient, coordinator: XScheduleCoordinator, entry: ConfigEntry) -> None:
-        super().__init__(client, coordinator, entry)
-        device_slug = slugify_entry_title(entry)
-        self.entity_id = f"button.{DOMAIN}_{device_slug}_restart_step"
-
-    @property
-    def unique_id(self) -> str:
-        return f"{self._entry.data['host']}:{self._entry.data['port']}:button_restart_step"
+    def __init__(self, client: XScheduleClient, coordinator: XScheduleCoordinator, entry: ConfigEntry, host_port: str) -> None:
+        super().__init__(client, coordinator, entry, host_port)
+        self._attr_unique_id = f"{host_port}:button_restart_step"
+        self.entity_id = f"button.{DOMAIN}_{self._device_slug}_restart_step"
 
     async def async_press(self) -> None:
         await self._client.restart_step()
@@ -110,14 +87,10 @@ class StopAllNowButton(BaseXScheduleButton):
     _attr_translation_key = "stop_all_now"
     _attr_icon = "mdi:stop-circle"
 
-    def __init__(self, client: XScheduleClient, coordinator: XScheduleCoordinator, entry: ConfigEntry) -> None:
-        super().__init__(client, coordinator, entry)
-        device_slug = slugify_entry_title(entry)
-        self.entity_id = f"button.{DOMAIN}_{device_slug}_stop_all_now"
-
-    @property
-    def unique_id(self) -> str:
-        return f"{self._entry.data['host']}:{self._entry.data['port']}:button_stop_all_now"
+    def __init__(self, client: XScheduleClient, coordinator: XScheduleCoordinator, entry: ConfigEntry, host_port: str) -> None:
+        super().__init__(client, coordinator, entry, host_port)
+        self._attr_unique_id = f"{host_port}:button_stop_all_now"
+        self.entity_id = f"button.{DOMAIN}_{self._device_slug}_stop_all_now"
 
     async def async_press(self) -> None:
         await self._client.stop_all_now()
@@ -129,14 +102,10 @@ class CloseXScheduleButton(BaseXScheduleButton):
     _attr_translation_key = "close_xschedule"
     _attr_icon = "mdi:close-circle"
 
-    def __init__(self, client: XScheduleClient, coordinator: XScheduleCoordinator, entry: ConfigEntry) -> None:
-        super().__init__(client, coordinator, entry)
-        device_slug = slugify_entry_title(entry)
-        self.entity_id = f"button.{DOMAIN}_{device_slug}_close_xschedule"
-
-    @property
-    def unique_id(self) -> str:
-        return f"{self._entry.data['host']}:{self._entry.data['port']}:button_close_xschedule"
+    def __init__(self, client: XScheduleClient, coordinator: XScheduleCoordinator, entry: ConfigEntry, host_port: str) -> None:
+        super().__init__(client, coordinator, entry, host_port)
+        self._attr_unique_id = f"{host_port}:button_close_xschedule"
+        self.entity_id = f"button.{DOMAIN}_{self._device_slug}_close_xschedule"
 
     async def async_press(self) -> None:
         # Request xSchedule to close; after this, the server will go away, so skip refresh
@@ -3,18 +3,66 @@ from __future__ import annotations
 import asyncio
 import hashlib
 import logging
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
-from aiohttp import ClientSession
+import orjson
+from aiohttp import ClientError, ClientSession
 from urllib.parse import quote
 
-from .const import REFERENCE_PREFIX
+from .const import DEFAULT_LISTS_REFRESH_SECS, REFERENCE_PREFIX
 
 _LOGGER = logging.getLogger(__name__)
 
+# Characters left unescaped when building query strings (spaces must become %20, not '+')
+_SAFE_CHARS = ",:+|-_:."
+
+# Pre-encoded "Command=..." prefixes for the fixed command names the integration sends
+_COMMAND_QS = {
+    name: f"Command={quote(name, safe=_SAFE_CHARS)}"
+    for name in (
+        "Stop",
+        "Stop all now",
+        "Pause",
+        "Next step in current playlist",
+        "Prior step in current playlist",
+        "Restart step in current playlist",
+        "Toggle current playlist loop",
+        "Toggle output to lights",
+        "Set volume to",
+        "Adjust volume by",
+        "Set step position ms",
+        "Set brightness to n%",
+        "Close xSchedule",
+        "Start test mode",
+        "Stop test mode",
+        "Play specified playlist",
+        "Play specified playlist looped",
+        "Play playlist step",
+        "Play specified step in specified playlist looped",
+        "Set playlist as background",
+        "Clear background playlist",
+    )
+}
+
+
+def _shallow_copy(value: Any) -> Any:
+    if isinstance(value, dict):
+        return dict(value)
+    if isinstance(value, list):
+        return list(value)
+    return value
+
 
 class XScheduleClient:
-    def __init__(self, session: ClientSession, host: str, port: int, password: str | None) -> None:
+    def __init__(
+        self,
+        session: ClientSession,
+        host: str,
+        port: int,
+        password: str | None,
+        steps_ttl: float = DEFAULT_LISTS_REFRESH_SECS,
+    ) -> None:
         self._session = session
         self._host = host
         self._port = port
@@ -22,11 +70,22 @@ class XScheduleClient:
         self._base = f"http://{host}:{port}"
         self._server_seen_ip: Optional[str] = None
         self._logged_in: bool = False
+        self._cached_cred: Optional[str] = None
+        self._cached_cred_ip: Optional[str] = None
         self._lock = asyncio.Lock()
+        # HA's shared session can't be reconfigured, so cap concurrent requests to
+        # the xSchedule host ourselves and let bursts reuse keep-alive sockets
+        self._conn_sem = asyncio.Semaphore(2)
+        self._ref_suffix = f"&Reference={quote(REFERENCE_PREFIX, safe=_SAFE_CHARS)}"
+
+        # in-flight idempotent queries shared between concurrent callers
+        self._inflight: Dict[str, asyncio.Future] = {}
 
         # caches
         self._playlists: List[Dict[str, Any]] | None = None
-        self._steps_cache: Dict[str, List[Dict[str, Any]]] = {}
+        # playlist -> (monotonic fetch time, steps); entries older than _steps_ttl are refetched
+        self._steps_cache: Dict[str, tuple[float, List[Dict[str, Any]]]] = {}
+        self._steps_ttl = steps_ttl
 
     @property
     def base_url(self) -> str:
@@ -53,7 +112,7 @@ class XScheduleClient:
         async with self._lock:
             # First try with known IP if we have one
             if self._server_seen_ip:
-                cred = self._md5(f"{self._server_seen_ip}{self._password}")
+                cred = self._credential_for(self._server_seen_ip)
                 ok = await self._login_with_credential(cred)
                 if ok:
                     return True
@@ -62,7 +121,7 @@ class XScheduleClient:
             hinted_ip = await self._get_hinted_ip()
             if hinted_ip:
                 self._server_seen_ip = hinted_ip
-                cred = self._md5(f"{hinted_ip}{self._password}")
+                cred = self._credential_for(hinted_ip)
                 ok = await self._login_with_credential(cred)
                 return ok
 
@@ -73,8 +132,8 @@ class XScheduleClient:
         params = {"Credential": "bad", "Reference": REFERENCE_PREFIX}
         try:
             async with self._session.get(url, params=params, timeout=10) as resp:
-                js = await resp.json(content_type=None)
-        except Exception as ex:  # broad catch to surface connection issues
+                js = orjson.loads(await resp.read())
+        except (ClientError, asyncio.TimeoutError, ValueError) as ex:
             _LOGGER.debug("Login hint failed: %s", ex)
             return None
         ip = js.get("ip")
@@ -86,8 +145,8 @@ class XScheduleClient:
         params = {"Credential": credential, "Reference": REFERENCE_PREFIX}
         try:
             async with self._session.get(url, params=params, timeout=10) as resp:
-                js = await resp.json(content_type=None)
-        except Exception as ex:
+                js = orjson.loads(await resp.read())
+        except (ClientError, asyncio.TimeoutError, ValueError) as ex:
             _LOGGER.debug("Login attempt failed: %s", ex)
             return False
 
@@ -104,69 +163,110 @@ class XScheduleClient:
     def _md5(self, text: str) -> str:
         return hashlib.md5(text.encode("utf-8")).hexdigest()
 
-    async def _ensure_login(self) -> None:
-        if not self._password:
-            return
-        if not self._logged_in:
-            await self.async_login()
+    def _credential_for(self, ip: str) -> str:
+        # Credential only depends on the server-seen IP; reuse it across re-logins
+        if self._cached_cred is None or self._cached_cred_ip != ip:
+            self._cached_cred = self._md5(f"{ip}{self._password}")
+            self._cached_cred_ip = ip
+        return self._cached_cred
+
+    async def _get_json(self, url: str, data: str | None = None) -> Dict[str, Any]:
+        async with self._conn_sem:
+            async with self._session.get(url, data=data, timeout=15) as resp:
+                return orjson.loads(await resp.read())
+
+    def _reference_qs(self, reference: str | None) -> str:
+        if not reference:
+            return self._ref_suffix
+        return f"&Reference={quote(reference, safe=_SAFE_CHARS)}"
 
     async def query(self, query: str, parameters: str = "", reference: str | None = None) -> Dict[str, Any]:
-        await self._ensure_login()
-        base = f"{self._base}/xScheduleQuery"
-        # Manually build query string to ensure spaces become %20 (not '+')
-        qp = {
-            "Query": query,
-            "Parameters": parameters,
-            "Reference": reference or REFERENCE_PREFIX,
-        }
-        safe_chars = ",:+|-_:."
-        qs = "&".join(f"{k}={quote(str(v), safe=safe_chars)}" for k, v in qp.items())
-        url = f"{base}?{qs}"
-        async with self._session.get(url, timeout=15) as resp:
-            js = await resp.json(content_type=None)
+        # Inline check avoids a coroutine hop per request on passwordless servers
+        if self._password and not self._logged_in:
+            await self.async_login()
+        url = (
+            f"{self._base}/xScheduleQuery?Query={quote(query, safe=_SAFE_CHARS)}"
+            f"&Parameters={quote(str(parameters), safe=_SAFE_CHARS)}{self._reference_qs(reference)}"
+        )
+        js = await self._get_json(url)
         # Handle not logged in (password enabled)
         if js.get("result") == "not logged in":
             self._logged_in = False
-            await self._ensure_login()
-            async with self._session.get(url, timeout=15) as resp:
-                js = await resp.json(content_type=None)
+            await self.async_login()
+            js = await self._get_json(url)
         return js
 
     async def command(self, command: str, parameters: str = "", data: str = "", reference: str | None = None) -> Dict[str, Any]:
-        await self._ensure_login()
-        base = f"{self._base}/xScheduleCommand"
-        qp = {
-            "Command": command,
-            "Parameters": parameters,
-            "Reference": reference or REFERENCE_PREFIX,
-        }
-        safe_chars = ",:+|-_:."
-        qs = "&".join(f"{k}={quote(str(v), safe=safe_chars)}" for k, v in qp.items())
-        url = f"{base}?{qs}"
-        async with self._session.get(url, data=data, timeout=15) as resp:
-            js = await resp.json(content_type=None)
+        if self._password and not self._logged_in:
+            await self.async_login()
+        command_qs = _COMMAND_QS.get(command) or f"Command={quote(command, safe=_SAFE_CHARS)}"
+        url = (
+            f"{self._base}/xScheduleCommand?{command_qs}"
+            f"&Parameters={quote(str(parameters), safe=_SAFE_CHARS)}{self._reference_qs(reference)}"
+        )
+        js = await self._get_json(url, data=data)
         if js.get("result") == "not logged in":
             self._logged_in = False
-            await self._ensure_login()
-            async with self._session.get(url, data=data, timeout=15) as resp:
-                js = await resp.json(content_type=None)
+            await self.async_login()
+            js = await self._get_json(url, data=data)
         return js
 
+    async def _single_flight(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        # Collapse concurrent identical reads (e.g. a poll overlapping a service refresh)
+        while (pending := self._inflight.get(key)) is not None:
+            try:
+                return _shallow_copy(await asyncio.shield(pending))
+            except asyncio.CancelledError:
+                # Only the caller that started the fetch was cancelled; run it ourselves
+                if not pending.cancelled() or asyncio.current_task().cancelling():
+                    raise
+
+        fut: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+        try:
+            result = await fetch()
+        except asyncio.CancelledError:
+            fut.cancel()
+            raise
+        except Exception as ex:
+            fut.set_exception(ex)
+            # Mark retrieved so an unshared failure doesn't log "never retrieved"
+            fut.exception()
+            raise
+        else:
+            # Callers mutate the payload in place; waiters get their own copy of it
+            fut.set_result(_shallow_copy(result))
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
     # Convenience wrappers
     async def get_playlists(self) -> List[Dict[str, Any]]:
+        return await self._single_flight("playlists", self._fetch_playlists)
+
+    async def _fetch_playlists(self) -> List[Dict[str, Any]]:
         js = await self.query("GetPlayLists")
         pls = js.get("playlists", [])
         self._playlists = pls
         return pls
 
     async def get_steps(self, playlist_name_or_id: str) -> List[Dict[str, Any]]:
+        cached = self._steps_cache.get(playlist_name_or_id)
+        if cached is not None and time.monotonic() - cached[0] < self._steps_ttl:
+            return cached[1]
         js = await self.query("GetPlayListSteps", parameters=playlist_name_or_id)
         steps = js.get("steps", [])
-        self._steps_cache[playlist_name_or_id] = steps
+        self._steps_cache[playlist_name_or_id] = (time.monotonic(), steps)
         return steps
 
+    def invalidate_steps(self, playlist_name_or_id: str | None = None) -> None:
+        if playlist_name_or_id is None:
+            self._steps_cache.clear()
+        else:
+            self._steps_cache.pop(playlist_name_or_id, None)
+
     async def get_playing_status(self) -> Dict[str, Any]:
-        return await self.query("GetPlayingStatus")
+        return await self._single_flight("status", lambda: self.query("GetPlayingStatus"))
 
     async def play_playlist(self, playlist: str, looped: bool = False) -> Dict[str, Any]:
         cmd = "Play specified playlist looped" if looped else "Play specified playlist"
@@ -1,4 +1,6 @@
+import functools
 import re
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 
@@ -18,6 +20,9 @@ DEFAULT_POLL_PLAYING = 2
 DEFAULT_POLL_IDLE = 2
 DEFAULT_ENABLE_BROWSE = True
 
+# Ceiling for the idle poll interval while the server keeps reporting the same status
+IDLE_BACKOFF_MAX_SECS = 300
+
 PLATFORMS = [
     "media_player",
     "switch",
@@ -29,6 +34,9 @@ PLATFORMS = [
 
 REFERENCE_PREFIX = "ha:xlights_scheduler"
 
+_SLUG_NONALNUM = re.compile(r"[^a-z0-9]+")
+_SLUG_DEDUP = re.compile(r"_+")
+
 # Home Assistant event names fired by the integration
 EVENT_SCHEDULE_STARTED = f"{DOMAIN}_schedule_started"
 EVENT_SCHEDULE_ENDED = f"{DOMAIN}_schedule_ended"
@@ -52,14 +60,35 @@ def slugify_entry_title(entry: ConfigEntry) -> str:
     Used to build stable, human-readable entity_ids of the form:
     <platform>.xlights_scheduler_<user_given_device_name>_<entity_name>
     """
-    name = (entry.title or "").strip()
+    return _slugify(entry.title or "", str(entry.data.get(CONF_HOST, "")), str(entry.data.get(CONF_PORT, "")))
+
+
+@functools.lru_cache(maxsize=64)
+def _slugify(title: str, host: str, port: str) -> str:
+    # Every entity of an entry slugifies the same inputs; compute it once
+    name = title.strip()
     if not name:
-        host = str(entry.data.get(CONF_HOST, "")).strip()
-        port = str(entry.data.get(CONF_PORT, "")).strip()
-        name = "_".join(part for part in (host, port) if part)
+        name = "_".join(part for part in (host.strip(), port.strip()) if part)
     if not name:
         name = DOMAIN
 
-    slug = re.sub(r"[^a-z0-9]+", "_", name.lower())
-    slug = re.sub(r"_+", "_", slug).strip("_")
+    slug = _SLUG_NONALNUM.sub("_", name.lower())
+    slug = _SLUG_DEDUP.sub("_", slug).strip("_")
     return slug or DOMAIN
+
+
+def parse_int(value: Any) -> int | None:
+    """Return an xSchedule numeric field as int, or None when it isn't numeric.
+
+    Explicit type checks keep entity property reads free of exception handling.
+    """
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        # Same inputs int() accepts: surrounding whitespace and an optional sign
+        text = value.strip()
+        digits = text[1:] if text[:1] in ("+", "-") else text
+        return int(text) if digits.isdecimal() else None
+    if isinstance(value, float):
+        return int(value)
+    return None
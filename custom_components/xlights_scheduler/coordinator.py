@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import datetime as dt
 import logging
+import time
 from typing import Any, Dict
 from homeassistant.util import dt as dt_util
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .client import XScheduleClient
@@ -25,15 +27,119 @@ from .const import (
     EVENT_OUTPUT_TOGGLED,
     EVENT_PLAYLIST_LOOP_CHANGED,
     EVENT_VERSION_CHANGED,
+    IDLE_BACKOFF_MAX_SECS,
+    parse_int,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+_ACTIVE_STATES: frozenset[str] = frozenset({"playing", "paused"})
+
+# xSchedule reports booleans as "true"/"false" strings
+_TRUE_VALUES = frozenset({"true", "True", "TRUE", True})
+
+
+def _as_bool(value: Any) -> bool:
+    if isinstance(value, str):
+        return value in _TRUE_VALUES or value.lower() == "true"
+    return value is True
+
+
+# Status keys that change on every poll without reflecting a state change
+_VOLATILE_STATUS_KEYS = frozenset({"time"})
+
+
+def _same_status(new: Dict[str, Any], old: Dict[str, Any] | None) -> bool:
+    if old is None or len(new) != len(old):
+        return False
+    for key, value in new.items():
+        if key in _VOLATILE_STATUS_KEYS:
+            continue
+        if key not in old or old[key] != value:
+            return False
+    return True
+
+
+class _LastState:
+    """Last-known server values used for change detection between polls."""
+
+    __slots__ = (
+        "schedule_id",
+        "schedule_name",
+        "schedule_end",
+        "version",
+        "status",
+        "playlist",
+        "playlist_id",
+        "step",
+        "output",
+        "playlist_loop",
+    )
+
+    def __init__(self) -> None:
+        for name in self.__slots__:
+            setattr(self, name, None)
+
+
+def _step_changed_payload(cur: Any, prev: Any, status: Dict[str, Any], cur_status: str, device: str) -> Dict[str, Any] | None:
+    if not (cur or prev):
+        return None
+    return {
+        "playlist": status.get("playlist"),
+        "playlistid": status.get("playlistid"),
+        "step": cur,
+        "stepid": status.get("stepid"),
+        "previous_step": prev,
+        "status": cur_status,
+        "device": device,
+    }
+
+
+def _output_toggled_payload(cur: Any, prev: Any, status: Dict[str, Any], cur_status: str, device: str) -> Dict[str, Any] | None:
+    if prev is None:
+        return None
+    return {
+        "state": cur,
+        "playlist": status.get("playlist"),
+        "playlistid": status.get("playlistid"),
+        "status": cur_status,
+        "device": device,
+    }
+
+
+def _playlist_loop_changed_payload(cur: Any, prev: Any, status: Dict[str, Any], cur_status: str, device: str) -> Dict[str, Any] | None:
+    if prev is None:
+        return None
+    return {
+        "loop": cur,
+        "playlist": status.get("playlist"),
+        "playlistid": status.get("playlistid"),
+        "status": cur_status,
+        "device": device,
+    }
+
 
 class XScheduleCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
-    def __init__(self, hass: HomeAssistant, client: XScheduleClient, options: dict[str, Any]) -> None:
+    # (_LastState slot, event, value getter, payload builder) for single-field change events;
+    # builders return None when the change should not fire an event
+    _CHANGE_FIELDS = (
+        ("step", EVENT_STEP_CHANGED, lambda st: st.get("step"), _step_changed_payload),
+        ("output", EVENT_OUTPUT_TOGGLED, lambda st: st["outputtolights_bool"], _output_toggled_payload),
+        ("playlist_loop", EVENT_PLAYLIST_LOOP_CHANGED, lambda st: st["playlistlooping_bool"], _playlist_loop_changed_payload),
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: XScheduleClient,
+        options: dict[str, Any],
+        entry_id: str | None = None,
+    ) -> None:
         self.client = client
         self._options = options or {}
+        # Used to look up the playlist selected in the entry's hass.data store
+        self._entry_id = entry_id
+        self._device_tag = f"{DOMAIN}:{id(self)}"
 
         interval = dt.timedelta(seconds=self._options.get(CONF_POLL_IDLE, DEFAULT_POLL_IDLE))
         super().__init__(
@@ -41,34 +147,42 @@ class XScheduleCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
             _LOGGER,
             name="xlights_scheduler_coordinator",
             update_interval=interval,
+            # Status payloads compare cleanly; skip listener callbacks when nothing changed
+            always_update=False,
         )
 
+        # Time the last status payload was fetched; kept off the data dict so
+        # identical payloads compare equal between polls
+        self.last_fetch_ts: dt.datetime | None = None
+
         self._last_playlists: list[dict[str, Any]] | None = None
-        self._last_playlists_ts: dt.datetime | None = None
+        # Named playlists derived from _last_playlists; rebuilt only when it is reassigned
+        self.playlist_names: list[str] = []
+        # Monotonic time of the last playlists fetch; None forces a refetch
+        self._last_playlists_mono: float | None = None
         self._lists_refresh_secs: int = self._options.get(
             CONF_LISTS_REFRESH_SECS, DEFAULT_LISTS_REFRESH_SECS
         )
-        self._last_schedule_id: str | None = None
-        self._last_schedule_name: str | None = None
-        self._last_schedule_end: str | None = None
-        self._last_version: str | None = None
-        self._last_status: str | None = None
-        self._last_playlist: str | None = None
-        self._last_playlist_id: str | None = None
-        self._last_step: str | None = None
-        self._last_output: bool | None = None
-        self._last_playlist_loop: bool | None = None
+        # Last-known values used for change detection between polls
+        self._last = _LastState()
 
+        self._last_raw_status: Dict[str, Any] | None = None
+        # Consecutive polls with an unchanged status; stretches the idle interval
+        self._stable_count = 0
         self._last_next_scheduled: Dict[str, Any] | None = None
-        self._last_next_scheduled_ts: dt.datetime | None = None
+        self._last_next_scheduled_mono: float | None = None
+        # Multiplier on the next-scheduled TTL; grows while idle results stay the same
+        self._next_sched_backoff = 1
 
     def _apply_interval_for_status(self, status: str) -> None:
-        playing = status in ("playing", "paused")
-        seconds = (
-            self._options.get(CONF_POLL_PLAYING, DEFAULT_POLL_PLAYING)
-            if playing
-            else self._options.get(CONF_POLL_IDLE, DEFAULT_POLL_IDLE)
-        )
+        playing = status in _ACTIVE_STATES
+        if playing:
+            seconds = self._options.get(CONF_POLL_PLAYING, DEFAULT_POLL_PLAYING)
+        else:
+            idle = self._options.get(CONF_POLL_IDLE, DEFAULT_POLL_IDLE)
+            # Back off exponentially while nothing changes, never below the configured rate
+            backoff = idle * (1 << (self._stable_count // 2))
+            seconds = max(idle, min(backoff, IDLE_BACKOFF_MAX_SECS))
         interval = dt.timedelta(seconds=seconds)
         # HA versions before async_set_update_interval supported setting the attribute directly
         setter = getattr(self, "async_set_update_interval", None)
@@ -77,32 +191,83 @@ class XScheduleCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
         else:
             self.update_interval = interval
 
-    async def _async_compute_next_scheduled(self) -> Dict[str, Any] | None:
-        now = dt_util.utcnow()
-        if (
-            self._last_next_scheduled is not None
-            and self._last_next_scheduled_ts is not None
-            and (now - self._last_next_scheduled_ts).total_seconds() <= self._lists_refresh_secs
-        ):
+    async def async_request_refresh(self) -> None:
+        # An explicit refresh follows a user action; poll at the base rate again
+        self._stable_count = 0
+        await super().async_request_refresh()
+
+    @callback
+    def async_request_refresh_background(self) -> None:
+        # For entity actions that don't need the refreshed data before returning
+        self.hass.async_create_background_task(
+            self.async_request_refresh(),
+            name=f"{DOMAIN} refresh after command",
+            eager_start=True,
+        )
+
+    def _playlists_due(self) -> bool:
+        return (
+            self._last_playlists is None
+            or self._last_playlists_mono is None
+            or time.monotonic() - self._last_playlists_mono > self._lists_refresh_secs
+        )
+
+    def _next_scheduled_due(self, now: float) -> bool:
+        return (
+            self._last_next_scheduled is None
+            or self._last_next_scheduled_mono is None
+            or now - self._last_next_scheduled_mono
+            > self._lists_refresh_secs * self._next_sched_backoff
+        )
+
+    def _active_playlist(self, status: Dict[str, Any] | None) -> str | None:
+        store = self.hass.data.get(DOMAIN, {}).get(self._entry_id) if self._entry_id else None
+        sel = store.get("selected_playlist") if store else None
+        if sel:
+            return sel
+        return (status or {}).get("playlist")
+
+    def _steps_playlist_changed(self, playlist: str | None) -> bool:
+        # Step lists themselves are TTL-cached by the client; this only catches a new selection
+        return playlist != (self.data or {}).get("_steps_playlist")
+
+    @callback
+    def _fire_events(self, events: list[tuple[str, Dict[str, Any]]]) -> None:
+        for event, payload in events:
+            self.hass.bus.async_fire(event, payload)
+
+    async def _async_compute_next_scheduled(self, active: bool) -> Dict[str, Any] | None:
+        mono = time.monotonic()
+        if not self._next_scheduled_due(mono):
             return self._last_next_scheduled
+        previous = self._last_next_scheduled
+        # Wall-clock time is still needed to compare against the schedules' start times
+        now = dt_util.utcnow()
 
-        playlists = self._last_playlists or []
+        playlists = [pl for pl in self._last_playlists or [] if pl.get("name")]
         best: Dict[str, Any] | None = None
         best_start: dt.datetime | None = None
 
-        for pl in playlists:
-            name = pl.get("name")
-            if not name:
-                continue
-            try:
-                js = await self.client.query("GetPlayListSchedules", parameters=name)
-            except Exception:
+        # Schedule lookups are independent per playlist; issue them concurrently
+        results = await asyncio.gather(
+            *(
+                self.client.query("GetPlayListSchedules", parameters=pl["name"])
+                for pl in playlists
+            ),
+            return_exceptions=True,
+        )
+
+        for pl, js in zip(playlists, results):
+            if isinstance(js, BaseException):
+                if isinstance(js, asyncio.CancelledError):
+                    raise js
                 continue
+            name = pl["name"]
             schedules = js.get("schedules") or []
             for sch in schedules:
                 enabled = str(sch.get("enabled", "")).upper()
-                active = str(sch.get("active", "")).upper()
-                if enabled != "TRUE" or active == "TRUE":
+                sch_active = str(sch.get("active", "")).upper()
+                if enabled != "TRUE" or sch_active == "TRUE":
                     continue
                 next_active = str(sch.get("nextactive") or "").strip()
                 if not next_active:
@@ -142,8 +307,14 @@ class XScheduleCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
         else:
             result = best
 
+        # While idle and nothing moves, look up the schedules less and less often
+        if not active and previous is not None and result == previous:
+            self._next_sched_backoff = min(self._next_sched_backoff * 2, 10)
+        else:
+            self._next_sched_backoff = 1
+
         self._last_next_scheduled = result
-        self._last_next_scheduled_ts = now
+        self._last_next_scheduled_mono = mono
         return result
 
     async def _async_update_data(self) -> Dict[str, Any]:
@@ -152,63 +323,126 @@ class XScheduleCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
         except Exception as err:
             raise UpdateFailed(err) from err
 
+        unchanged = self.data is not None and _same_status(status, self._last_raw_status)
+        self._stable_count = min(self._stable_count + 1, 10) if unchanged else 0
+
         if isinstance(status, dict) and status.get("status"):
             self._apply_interval_for_status(status.get("status", "idle"))
         else:
             self._apply_interval_for_status("idle")
 
+        # Idle servers usually return the same payload poll after poll; when nothing
+        # else is due, hand back the previous data and skip change detection entirely
+        now = time.monotonic()
+        if (
+            unchanged
+            and not self._playlists_due()
+            and not self._next_scheduled_due(now)
+            and not self._steps_playlist_changed(self._active_playlist(status))
+        ):
+            self.last_fetch_ts = dt_util.utcnow()
+            return self.data
+        self._last_raw_status = dict(status)
+
+        cur_status = str(status.get("status") or "idle").lower()
+        # Shared with entities so they don't re-lowercase on every state read
+        status["_status_lc"] = cur_status
+        # Booleans coerced once from xSchedule's "true"/"false" strings
+        status["outputtolights_bool"] = _as_bool(status.get("outputtolights"))
+        status["playlistlooping_bool"] = _as_bool(status.get("playlistlooping"))
+        active = cur_status in _ACTIVE_STATES
+        if active:
+            self._next_sched_backoff = 1
+
+        # Events are collected and dispatched together once listeners have seen the new data
+        pending_events: list[tuple[str, Dict[str, Any]]] = []
+
         # If version changes (server restart/upgrade), force immediate refresh and fire event
         try:
             ver = status.get("version")
         except Exception:
             ver = None
-        if ver and ver != self._last_version:
-            self._last_playlists_ts = None
-            self._last_version = ver
+        last = self._last
+        if ver and ver != last.version:
+            self._last_playlists_mono = None
+            last.version = ver
+            self.client.invalidate_steps()
             self._last_next_scheduled = None
-            self._last_next_scheduled_ts = None
-            self.hass.bus.async_fire(
+            self._last_next_scheduled_mono = None
+            self._next_sched_backoff = 1
+            pending_events.append((
                 EVENT_VERSION_CHANGED,
                 {
                     "version": ver,
-                    "device": f"{DOMAIN}:{id(self)}",
+                    "device": self._device_tag,
                 },
-            )
+            ))
 
         # Refresh playlists on first run and then periodically
-        now = dt_util.utcnow()
-        if (
-            self._last_playlists is None
-            or self._last_playlists_ts is None
-            or (now - self._last_playlists_ts).total_seconds() > self._lists_refresh_secs
-        ):
+        if self._playlists_due():
             try:
-                self._last_playlists = await self.client.get_playlists()
-                self._last_playlists_ts = now
-                self._last_next_scheduled = None
-                self._last_next_scheduled_ts = None
+                playlists = await self.client.get_playlists()
+                self._last_playlists_mono = time.monotonic()
+                # Keep the existing list (and anything cached against it) when nothing changed
+                if playlists != self._last_playlists:
+                    self._last_playlists = playlists
+                    self.playlist_names = [pl["name"] for pl in playlists if pl.get("name")]
+                    self._last_next_scheduled = None
+                    self._last_next_scheduled_mono = None
+                    self._next_sched_backoff = 1
             except Exception:
                 pass
 
         status["_playlists"] = self._last_playlists or []
+
+        # Steps for the selected (or playing) playlist, shared by the step select and sensor
+        step_pl = self._active_playlist(status)
+        steps_by_pl: Dict[str, list[str]] = {}
+        if step_pl:
+            try:
+                steps = await self.client.get_steps(step_pl)
+                steps_by_pl[step_pl] = [s.get("name") for s in steps if s.get("name")]
+            except Exception:
+                # Keep showing the last list we had for this playlist
+                previous = (self.data or {}).get("_steps", {})
+                if step_pl in previous:
+                    steps_by_pl[step_pl] = previous[step_pl]
+        status["_steps"] = steps_by_pl
+        # Part of the compared payload so switching the selection always notifies listeners,
+        # even back to a playlist whose steps are unchanged
+        status["_steps_playlist"] = step_pl
+        # Volume as the 0..1 fraction HA expects, parsed once per payload
+        volume = parse_int(status.get("volume"))
+        status["_volume_fraction"] = max(0.0, min(1.0, volume / 100.0)) if volume is not None else None
         # Stamp the time this payload was fetched so entities can animate progress
-        status["_ts"] = dt_util.utcnow()
+        self.last_fetch_ts = dt_util.utcnow()
 
         try:
-            next_sched = await self._async_compute_next_scheduled()
+            next_sched = await self._async_compute_next_scheduled(active)
             status["_next_scheduled"] = next_sched
         except Exception:
+            next_sched = None
             status["_next_scheduled"] = None
+        # (start, end, playlistname, schedulename) so the sensors unpack instead of re-reading the dict
+        if next_sched:
+            status["_next_scheduled_parsed"] = (
+                next_sched.get("start"),
+                next_sched.get("end"),
+                next_sched.get("playlistname"),
+                next_sched.get("schedulename"),
+            )
+        else:
+            status["_next_scheduled_parsed"] = (None, None, None, None)
 
         # Fire HA events on schedule start/stop
         cur_sched_id: str | None = None
         raw_id = str(status.get("scheduleid", "")) if isinstance(status, dict) else ""
-        if status.get("status") in ("playing", "paused") and raw_id and raw_id.upper() != "N/A":
+        if status.get("status") in _ACTIVE_STATES and raw_id and raw_id.upper() != "N/A":
             cur_sched_id = raw_id
 
-        if cur_sched_id and cur_sched_id != self._last_schedule_id:
+        if cur_sched_id and cur_sched_id != last.schedule_id:
             # schedule started (or changed)
-            self.hass.bus.async_fire(
+            pending_events.append((
                 EVENT_SCHEDULE_STARTED,
                 {
                     "scheduleid": cur_sched_id,
@@ -216,124 +450,87 @@ class XScheduleCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
                     "playlistid": status.get("playlistid"),
                     "playlist": status.get("playlist"),
                     "scheduleend": status.get("scheduleend"),
-                    "device": f"{DOMAIN}:{id(self)}",
+                    "device": self._device_tag,
                     "host": self.client.host,
                     "port": self.client.port,
                     "base_url": self.client.base_url,
                 },
-            )
+            ))
             # Remember schedule context for matching ended event
-            self._last_schedule_name = status.get("schedulename")
-            self._last_schedule_end = status.get("scheduleend")
+            last.schedule_name = status.get("schedulename")
+            last.schedule_end = status.get("scheduleend")
 
-        if self._last_schedule_id and not cur_sched_id:
+        if last.schedule_id and not cur_sched_id:
             # schedule ended
-            self.hass.bus.async_fire(
+            pending_events.append((
                 EVENT_SCHEDULE_ENDED,
                 {
-                    "scheduleid": self._last_schedule_id,
-                    "schedulename": self._last_schedule_name,
-                    "scheduleend": self._last_schedule_end,
-                    "playlistid": self._last_playlist_id,
-                    "playlist": self._last_playlist,
-                    "device": f"{DOMAIN}:{id(self)}",
+                    "scheduleid": last.schedule_id,
+                    "schedulename": last.schedule_name,
+                    "scheduleend": last.schedule_end,
+                    "playlistid": last.playlist_id,
+                    "playlist": last.playlist,
+                    "device": self._device_tag,
                     "host": self.client.host,
                     "port": self.client.port,
                     "base_url": self.client.base_url,
                 },
-            )
-            self._last_schedule_name = None
-            self._last_schedule_end = None
+            ))
+            last.schedule_name = None
+            last.schedule_end = None
 
-        self._last_schedule_id = cur_sched_id
+        last.schedule_id = cur_sched_id
 
         # Derived state for playlist/step/events
-        cur_status = str(status.get("status") or "idle").lower()
         cur_playlist = status.get("playlist")
         cur_playlist_id = status.get("playlistid")
-        cur_step = status.get("step")
-        cur_step_id = status.get("stepid")
-        cur_output = str(status.get("outputtolights") or "false").lower() == "true"
-        cur_loop = str(status.get("playlistlooping") or "false").lower() == "true"
 
         # Playlist start/end (covers idle<->playing and playlist changes while playing)
-        if self._last_playlist and (
-            cur_playlist != self._last_playlist or cur_status not in ("playing", "paused")
+        if last.playlist and (
+            cur_playlist != last.playlist or cur_status not in _ACTIVE_STATES
         ):
-            self.hass.bus.async_fire(
+            pending_events.append((
                 EVENT_PLAYLIST_ENDED,
                 {
-                    "playlist": self._last_playlist,
-                    "playlistid": self._last_playlist_id,
+                    "playlist": last.playlist,
+                    "playlistid": last.playlist_id,
                     "status": cur_status,
-                    "device": f"{DOMAIN}:{id(self)}",
+                    "device": self._device_tag,
                 },
-            )
+            ))
 
-        if cur_status in ("playing", "paused"):
+        if cur_status in _ACTIVE_STATES:
             if cur_playlist and (
-                self._last_status not in ("playing", "paused")
-                or cur_playlist != self._last_playlist
+                last.status not in _ACTIVE_STATES
+                or cur_playlist != last.playlist
             ):
-                self.hass.bus.async_fire(
+                pending_events.append((
                     EVENT_PLAYLIST_STARTED,
                     {
                         "playlist": cur_playlist,
                         "playlistid": cur_playlist_id,
                         "status": cur_status,
                         "trigger": status.get("trigger"),
-                        "device": f"{DOMAIN}:{id(self)}",
+                        "device": self._device_tag,
                     },
-                )
-
-        # Step changed
-        if cur_step != self._last_step:
-            if cur_step or self._last_step:
-                self.hass.bus.async_fire(
-                    EVENT_STEP_CHANGED,
-                    {
-                        "playlist": cur_playlist,
-                        "playlistid": cur_playlist_id,
-                        "step": cur_step,
-                        "stepid": cur_step_id,
-                        "previous_step": self._last_step,
-                        "status": cur_status,
-                        "device": f"{DOMAIN}:{id(self)}",
-                    },
-                )
-
-        # Output to lights toggled
-        if self._last_output is not None and cur_output != self._last_output:
-            self.hass.bus.async_fire(
-                EVENT_OUTPUT_TOGGLED,
-                {
-                    "state": cur_output,
-                    "playlist": cur_playlist,
-                    "playlistid": cur_playlist_id,
-                    "status": cur_status,
-                    "device": f"{DOMAIN}:{id(self)}",
-                },
-            )
-
-        # Playlist loop state changed
-        if self._last_playlist_loop is not None and cur_loop != self._last_playlist_loop:
-            self.hass.bus.async_fire(
-                EVENT_PLAYLIST_LOOP_CHANGED,
-                {
-                    "loop": cur_loop,
-                    "playlist": cur_playlist,
-                    "playlistid": cur_playlist_id,
-                    "status": cur_status,
-                    "device": f"{DOMAIN}:{id(self)}",
-                },
-            )
+                ))
+
+        # Step changed, output to lights toggled, playlist loop state changed
+        for name, event, current, build in self._CHANGE_FIELDS:
+            cur = current(status)
+            prev = getattr(last, name)
+            if cur != prev:
+                payload = build(cur, prev, status, cur_status, self._device_tag)
+                if payload is not None:
+                    pending_events.append((event, payload))
+                setattr(last, name, cur)
 
         # Update last-known state for next cycle
-        self._last_status = cur_status
-        self._last_playlist = cur_playlist
-        self._last_playlist_id = cur_playlist_id
-        self._last_step = cur_step
-        self._last_output = cur_output
-        self._last_playlist_loop = cur_loop
+        last.status = cur_status
+        last.playlist = cur_playlist
+        last.playlist_id = cur_playlist_id
+
+        if pending_events:
+            self.hass.loop.call_soon(self._fire_events, pending_events)
 
         return status
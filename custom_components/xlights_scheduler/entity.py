@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .client import XScheduleClient
+from .coordinator import XScheduleCoordinator
+from .const import DOMAIN, INTEGRATION_VERSION
+
+
+class XScheduleEntity(CoordinatorEntity[XScheduleCoordinator]):
+    """Base for the entities of one xSchedule device (config entry)."""
+
+    def __init__(
+        self,
+        client: XScheduleClient,
+        coordinator: XScheduleCoordinator,
+        entry: ConfigEntry,
+        host_port: str,
+    ) -> None:
+        super().__init__(coordinator)
+        self._client = client
+        self._entry = entry
+        self._host_port = host_port
+        self._base_device_info = {
+            "identifiers": {(DOMAIN, host_port)},
+            "name": "xLights Scheduler",
+            "manufacturer": "xLights",
+            "model": "xSchedule",
+        }
+        self._device_info_cache: tuple[str, dict] | None = None
+
+    @property
+    def device_info(self):
+        xs_ver = (self.coordinator.data or {}).get("version") if self.coordinator else None
+        # Report xSchedule version as firmware; fall back to integration version
+        sw_version = xs_ver or INTEGRATION_VERSION
+        # Only rebuild the dict when the reported xSchedule version changes
+        cache = self._device_info_cache
+        if cache is None or cache[0] != sw_version:
+            cache = (sw_version, self._base_device_info | {"sw_version": sw_version})
+            self._device_info_cache = cache
+        return cache[1]
+
+    def _refresh_attrs(self) -> bool:
+        # Subclasses cache their state here and return False when nothing changed
+        return True
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self._refresh_attrs()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        if self._refresh_attrs():
+            self.async_write_ha_state()
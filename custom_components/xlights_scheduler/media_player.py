@@ -13,11 +13,11 @@ from homeassistant.components.media_player import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .client import XScheduleClient
 from .coordinator import XScheduleCoordinator
-from .const import DOMAIN, INTEGRATION_VERSION, slugify_entry_title
+from .entity import XScheduleEntity
+from .const import DOMAIN, parse_int, slugify_entry_title
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,23 +27,45 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     client: XScheduleClient = data["client"]
     coordinator: XScheduleCoordinator = data["coordinator"]
 
-    async_add_entities([XScheduleMediaPlayer(client, coordinator, entry)])
+    async_add_entities([XScheduleMediaPlayer(client, coordinator, entry, data["host_port"])])
 
 
-class XScheduleMediaPlayer(CoordinatorEntity[XScheduleCoordinator], MediaPlayerEntity):
+class XScheduleMediaPlayer(XScheduleEntity, MediaPlayerEntity):
     _attr_has_entity_name = True
     _attr_translation_key = "xlights"
+    _attr_should_poll = False
 
-    def __init__(self, client: XScheduleClient, coordinator: XScheduleCoordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator)
-        self._client = client
-        self._entry = entry
-        self._attr_unique_id = f"{entry.data['host']}:{entry.data['port']}:media_player"
+    def __init__(self, client: XScheduleClient, coordinator: XScheduleCoordinator, entry: ConfigEntry, host_port: str) -> None:
+        super().__init__(client, coordinator, entry, host_port)
+        self._attr_unique_id = f"{host_port}:media_player"
         device_slug = slugify_entry_title(entry)
         # media_player.xlights_scheduler_<user_device_name>_xlights
         self.entity_id = f"media_player.{DOMAIN}_{device_slug}_xlights"
         self._last_volume_pct: int | None = None
         self._last_playlist: str | None = None
+        # (playlists list, children) for the Playlists browse node; keyed by list identity
+        self._browse_children_cache: tuple[list, list[BrowseMedia]] | None = None
+        # Static browse root; HA serializes a copy per request so sharing it is safe
+        self._browse_root = BrowseMedia(
+            title="xSchedule",
+            media_class=MediaClass.DIRECTORY,
+            media_content_type="xlights_root",
+            media_content_id="root",
+            can_play=False,
+            can_expand=True,
+            children=[
+                # Do not embed children here; handle in the dedicated branch below
+                BrowseMedia(
+                    title="Playlists",
+                    media_class=MediaClass.DIRECTORY,
+                    media_content_type="xlights_playlists",
+                    media_content_id="playlists",
+                    can_play=False,
+                    can_expand=True,
+                    children=[],
+                )
+            ],
+        )
         self._attr_supported_features = (
             MediaPlayerEntityFeature.PLAY
             | MediaPlayerEntityFeature.PAUSE
@@ -58,22 +80,10 @@ class XScheduleMediaPlayer(CoordinatorEntity[XScheduleCoordinator], MediaPlayerE
             | MediaPlayerEntityFeature.SELECT_SOURCE
         )
 
-    @property
-    def device_info(self):
-        xs_ver = (self.coordinator.data or {}).get("version") if self.coordinator else None
-        return {
-            "identifiers": {(DOMAIN, f"{self._entry.data['host']}:{self._entry.data['port']}")},
-            "name": "xLights Scheduler",
-            "manufacturer": "xLights",
-            "model": "xSchedule",
-            # Report xSchedule version as firmware; fall back to integration version
-            "sw_version": xs_ver or INTEGRATION_VERSION,
-        }
-
     @property
     def state(self):
         data = self.coordinator.data or {}
-        status = (data.get("status") or "idle").lower()
+        status = data.get("_status_lc")
         if status == "playing":
             return "playing"
         if status == "paused":
@@ -83,15 +93,7 @@ class XScheduleMediaPlayer(CoordinatorEntity[XScheduleCoordinator], MediaPlayerE
     @property
     def volume_level(self) -> Optional[float]:
         data = self.coordinator.data or {}
-        vol = data.get("volume")
-        try:
-            v = int(vol)
-            # Track last non-zero volume for reliable unmute
-            if v > 0:
-                self._last_volume_pct = v
-            return max(0.0, min(1.0, v / 100.0))
-        except Exception:
-            return None
+        return data.get("_volume_fraction")
 
     @property
     def is_volume_muted(self) -> Optional[bool]:
@@ -101,18 +103,14 @@ class XScheduleMediaPlayer(CoordinatorEntity[XScheduleCoordinator], MediaPlayerE
     @property
     def media_duration(self) -> Optional[int]:
         data = self.coordinator.data or {}
-        try:
-            return int(data.get("lengthms", 0)) // 1000
-        except Exception:
-            return None
+        ms = parse_int(data.get("lengthms", 0))
+        return ms // 1000 if ms is not None else None
 
     @property
     def media_position(self) -> Optional[int]:
         data = self.coordinator.data or {}
-        try:
-            return int(data.get("positionms", 0)) // 1000
-        except Exception:
-            return None
+        ms = parse_int(data.get("positionms", 0))
+        return ms // 1000 if ms is not None else None
 
     @property
     def media_title(self) -> Optional[str]:
@@ -130,10 +128,7 @@ class XScheduleMediaPlayer(CoordinatorEntity[XScheduleCoordinator], MediaPlayerE
 
     @property
     def source_list(self) -> Optional[list[str]]:
-        playlists = self.coordinator.data.get("_playlists") if self.coordinator.data else None
-        if not playlists:
-            return None
-        return [pl.get("name") for pl in playlists if pl.get("name")]
+        return self.coordinator.playlist_names or None
 
     async def async_select_source(self, source: str) -> None:
         # Treat source selection as queueing the playlist; user presses Play to start
@@ -238,12 +233,7 @@ class XScheduleMediaPlayer(CoordinatorEntity[XScheduleCoordinator], MediaPlayerE
         if self.state != "playing":
             return None
         # Prefer coordinator-stamped fetch time; fallback to now
-        ts = None
-        try:
-            ts = (self.coordinator.data or {}).get("_ts")
-        except Exception:
-            ts = None
-        return ts or dt_util.utcnow()
+        return self.coordinator.last_fetch_ts or dt_util.utcnow()
 
     async def async_browse_media(
         self, media_content_type: Optional[str] = None, media_content_id: Optional[str] = None
@@ -251,30 +241,29 @@ class XScheduleMediaPlayer(CoordinatorEntity[XScheduleCoordinator], MediaPlayerE
         playlists = self.coordinator.data.get("_playlists") if self.coordinator.data else []
 
         if not media_content_id:
-            root = BrowseMedia(
-                title="xSchedule",
-                media_class=MediaClass.DIRECTORY,
-                media_content_type="xlights_root",
-                media_content_id="root",
-                can_play=False,
-                can_expand=True,
-                children=[],
-            )
-            pls_node = BrowseMedia(
-                title="Playlists",
-                media_class=MediaClass.DIRECTORY,
-                media_content_type="xlights_playlists",
-                media_content_id="playlists",
-                can_play=False,
-                can_expand=True,
-                children=[],
-            )
-            # Do not embed children here; handle in the dedicated branch below
-            root.children.append(pls_node)
-            return root
+            return self._browse_root
 
         # Expand the Playlists directory node
         if media_content_type == "xlights_playlists":
+            playlists = playlists or []
+            # The coordinator only reassigns its playlists list on refetch
+            cache = self._browse_children_cache
+            if cache is None or cache[0] is not playlists:
+                cache = (
+                    playlists,
+                    [
+                        BrowseMedia(
+                            title=pl.get("name", ""),
+                            media_class=MediaClass.DIRECTORY,
+                            media_content_type="xlights_playlist",
+                            media_content_id=pl.get("name", ""),
+                            can_play=True,
+                            can_expand=True,
+                        )
+                        for pl in playlists
+                    ],
+                )
+                self._browse_children_cache = cache
             node = BrowseMedia(
                 title="Playlists",
                 media_class=MediaClass.DIRECTORY,
@@ -282,17 +271,7 @@ class XScheduleMediaPlayer(CoordinatorEntity[XScheduleCoordinator], MediaPlayerE
                 media_content_id="playlists",
                 can_play=False,
                 can_expand=True,
-                children=[
-                    BrowseMedia(
-                        title=pl.get("name", ""),
-                        media_class=MediaClass.DIRECTORY,
-                        media_content_type="xlights_playlist",
-                        media_content_id=pl.get("name", ""),
-                        can_play=True,
-                        can_expand=True,
-                    )
-                    for pl in playlists or []
-                ],
+                children=cache[1],
             )
             return node
 
@@ -350,4 +329,8 @@ class XScheduleMediaPlayer(CoordinatorEntity[XScheduleCoordinator], MediaPlayerE
         pl = data.get("playlist")
         if pl:
             self._last_playlist = pl
+        # Track last non-zero volume for reliable unmute
+        vol = data.get("_volume_fraction")
+        if vol:
+            self._last_volume_pct = round(vol * 100)
         super()._handle_coordinator_update()
@@ -7,11 +7,11 @@ from homeassistant.components.number import NumberEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .client import XScheduleClient
 from .coordinator import XScheduleCoordinator
-from .const import DOMAIN, INTEGRATION_VERSION, slugify_entry_title
+from .entity import XScheduleEntity
+from .const import DOMAIN, parse_int, slugify_entry_title
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -21,44 +21,29 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     client: XScheduleClient = data["client"]
     coordinator: XScheduleCoordinator = data["coordinator"]
 
-    async_add_entities([BrightnessNumber(client, coordinator, entry)])
+    async_add_entities([BrightnessNumber(client, coordinator, entry, data["host_port"])])
 
 
-class BrightnessNumber(CoordinatorEntity[XScheduleCoordinator], NumberEntity):
+class BrightnessNumber(XScheduleEntity, NumberEntity):
     _attr_has_entity_name = True
     _attr_translation_key = "brightness"
+    _attr_should_poll = False
     _attr_native_min_value = 0
     _attr_native_max_value = 100
     _attr_native_step = 1
     _attr_icon = "mdi:brightness-6"
     _attr_native_unit_of_measurement = "%"
 
-    def __init__(self, client: XScheduleClient, coordinator: XScheduleCoordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator)
-        self._client = client
-        self._entry = entry
-        self._attr_unique_id = f"{entry.data['host']}:{entry.data['port']}:number_brightness"
+    def __init__(self, client: XScheduleClient, coordinator: XScheduleCoordinator, entry: ConfigEntry, host_port: str) -> None:
+        super().__init__(client, coordinator, entry, host_port)
+        self._attr_unique_id = f"{host_port}:number_brightness"
         device_slug = slugify_entry_title(entry)
         self.entity_id = f"number.{DOMAIN}_{device_slug}_brightness"
 
-    @property
-    def device_info(self):
-        xs_ver = (self.coordinator.data or {}).get("version") if self.coordinator else None
-        return {
-            "identifiers": {(DOMAIN, f"{self._entry.data['host']}:{self._entry.data['port']}")},
-            "name": "xLights Scheduler",
-            "manufacturer": "xLights",
-            "model": "xSchedule",
-            "sw_version": xs_ver or INTEGRATION_VERSION,
-        }
-
     @property
     def native_value(self):
         data = self.coordinator.data or {}
-        try:
-            return int(data.get("brightness"))
-        except Exception:
-            return None
+        return parse_int(data.get("brightness"))
 
     async def async_set_native_value(self, value: float) -> None:
         await self._client.command("Set brightness to n%", parameters=str(int(value)))
@@ -2,18 +2,17 @@ from __future__ import annotations
 
 import logging
 from typing import Any
-from homeassistant.util import dt as dt_util
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .client import XScheduleClient
 from .coordinator import XScheduleCoordinator
-from .const import DOMAIN, INTEGRATION_VERSION, slugify_entry_title
+from .entity import XScheduleEntity
+from .const import DOMAIN, slugify_entry_title
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,92 +21,71 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     data = hass.data[DOMAIN][entry.entry_id]
     client: XScheduleClient = data["client"]
     coordinator: XScheduleCoordinator = data["coordinator"]
+    host_port: str = data["host_port"]
 
-    async_add_entities([
-        PlaylistSelect(hass, client, coordinator, entry),
-        StepSelect(hass, client, coordinator, entry),
-        BackgroundPlaylistSelect(hass, client, coordinator, entry),
-    ])
+    # Entities read coordinator data that is already populated; nothing to update before adding
+    async_add_entities(
+        (
+            PlaylistSelect(client, coordinator, entry, host_port, data),
+            StepSelect(client, coordinator, entry, host_port, data),
+            BackgroundPlaylistSelect(client, coordinator, entry, host_port, data),
+        ),
+        update_before_add=False,
+    )
 
 
-class PlaylistSelect(CoordinatorEntity[XScheduleCoordinator], SelectEntity):
+class PlaylistSelect(XScheduleEntity, SelectEntity):
     _attr_has_entity_name = True
     _attr_translation_key = "playlist"
     _attr_icon = "mdi:playlist-music"
 
-    def __init__(self, hass: HomeAssistant, client: XScheduleClient, coordinator: XScheduleCoordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator)
-        self.hass = hass
-        self._client = client
-        self._entry = entry
-        self._attr_unique_id = f"{entry.data['host']}:{entry.data['port']}:select_playlist"
+    def __init__(self, client: XScheduleClient, coordinator: XScheduleCoordinator, entry: ConfigEntry, host_port: str, store: dict[str, Any]) -> None:
+        super().__init__(client, coordinator, entry, host_port)
+        self._store = store
+        self._attr_unique_id = f"{host_port}:select_playlist"
+        # (available, current option, playlists) as last written; unchanged ticks skip the write
+        self._written: tuple[bool, str | None, list[str]] | None = None
+        self._attr_options: list[str] = []
         device_slug = slugify_entry_title(entry)
         self.entity_id = f"select.{DOMAIN}_{device_slug}_playlist"
 
-    @property
-    def device_info(self):
-        xs_ver = (self.coordinator.data or {}).get("version") if self.coordinator else None
-        return {
-            "identifiers": {(DOMAIN, f"{self._entry.data['host']}:{self._entry.data['port']}")},
-            "name": "xLights Scheduler",
-            "manufacturer": "xLights",
-            "model": "xSchedule",
-            "sw_version": xs_ver or INTEGRATION_VERSION,
-        }
-
-    @property
-    def options(self) -> list[str]:
-        playlists = self.coordinator.data.get("_playlists") if self.coordinator.data else []
-        return [pl.get("name") for pl in playlists or [] if pl.get("name")]
-
-    @property
-    def current_option(self) -> str | None:
-        sel = self.hass.data[DOMAIN][self._entry.entry_id].get("selected_playlist")
-        if sel:
-            return sel
+    def _refresh_attrs(self) -> bool:
         data = self.coordinator.data or {}
-        return data.get("playlist")
+        sel = self._store.get("selected_playlist")
+        # The coordinator only rebuilds playlist_names when the playlists change
+        names = self.coordinator.playlist_names
+        written = (self.available, sel or data.get("playlist"), names)
+        if written == self._written:
+            return False
+        self._written = written
+        self._attr_current_option = written[1]
+        self._attr_options = names
+        return True
 
     async def async_select_option(self, option: str) -> None:
-        store = self.hass.data[DOMAIN][self._entry.entry_id]
+        store = self._store
         store["selected_playlist"] = option
         # Clearing any queued step avoids an inconsistent combination
         store.pop("selected_step", None)
-        await self.coordinator.async_request_refresh()
+        if self._refresh_attrs():
+            self.async_write_ha_state()
+        self.coordinator.async_request_refresh_background()
 
 
-class StepSelect(CoordinatorEntity[XScheduleCoordinator], SelectEntity):
+class StepSelect(XScheduleEntity, SelectEntity):
     _attr_has_entity_name = True
     _attr_translation_key = "step"
     _attr_icon = "mdi:format-list-numbered"
 
-    def __init__(self, hass: HomeAssistant, client: XScheduleClient, coordinator: XScheduleCoordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator)
-        self.hass = hass
-        self._client = client
-        self._entry = entry
-        self._attr_unique_id = f"{entry.data['host']}:{entry.data['port']}:select_step"
+    def __init__(self, client: XScheduleClient, coordinator: XScheduleCoordinator, entry: ConfigEntry, host_port: str, store: dict[str, Any]) -> None:
+        super().__init__(client, coordinator, entry, host_port)
+        self._store = store
+        self._attr_unique_id = f"{host_port}:select_step"
         device_slug = slugify_entry_title(entry)
         self.entity_id = f"select.{DOMAIN}_{device_slug}_step"
-        self._cached_steps: dict[str, list[str]] = {}
-        self._last_playlist: str | None = None
-        self._steps_cache_ts: dict[str, Any] = {}
-        # Shorter TTL so step lists keep fresh more quickly after changes
-        self._steps_ttl_secs: int = 15
-
-    @property
-    def device_info(self):
-        xs_ver = (self.coordinator.data or {}).get("version") if self.coordinator else None
-        return {
-            "identifiers": {(DOMAIN, f"{self._entry.data['host']}:{self._entry.data['port']}")},
-            "name": "xLights Scheduler",
-            "manufacturer": "xLights",
-            "model": "xSchedule",
-            "sw_version": xs_ver or INTEGRATION_VERSION,
-        }
 
     def _get_active_playlist(self) -> str | None:
-        sel = self.hass.data[DOMAIN][self._entry.entry_id].get("selected_playlist")
+        sel = self._store.get("selected_playlist")
         if sel:
             return sel
         data = self.coordinator.data or {}
@@ -118,9 +96,8 @@ class StepSelect(CoordinatorEntity[XScheduleCoordinator], SelectEntity):
         pl = self._get_active_playlist()
         if not pl:
             return []
-        if pl in self._cached_steps:
-            return self._cached_steps[pl]
-        return []
+        steps = (self.coordinator.data or {}).get("_steps") or {}
+        return steps.get(pl, [])
 
     @property
     def available(self) -> bool:
@@ -131,84 +108,53 @@ class StepSelect(CoordinatorEntity[XScheduleCoordinator], SelectEntity):
         data = self.coordinator.data or {}
         return data.get("step")
 
-    async def async_update(self) -> None:
-        pl = self._get_active_playlist()
-        if pl:
-            need_refresh = False
-            if pl not in self._cached_steps:
-                need_refresh = True
-            else:
-                ts = self._steps_cache_ts.get(pl)
-                if not ts or (dt_util.utcnow() - ts).total_seconds() > self._steps_ttl_secs:
-                    need_refresh = True
-            if need_refresh:
-                steps = await self._client.get_steps(pl)
-                self._cached_steps[pl] = [s.get("name") for s in steps if s.get("name")]
-                self._steps_cache_ts[pl] = dt_util.utcnow()
-
-    def _handle_coordinator_update(self) -> None:
-        pl = self._get_active_playlist()
-        if pl:
-            expired = False
-            if pl in self._steps_cache_ts:
-                expired = (dt_util.utcnow() - self._steps_cache_ts[pl]).total_seconds() > self._steps_ttl_secs
-            if pl != self._last_playlist or expired or pl not in self._cached_steps:
-                self._last_playlist = pl
-                self.hass.async_create_task(self.async_update())
-        self.async_write_ha_state()
-
     async def async_select_option(self, option: str) -> None:
         pl = self._get_active_playlist()
         if not pl:
             return
-        store = self.hass.data[DOMAIN][self._entry.entry_id]
+        store = self._store
         store["selected_playlist"] = pl
         store["selected_step"] = option
         await self._client.command("Play playlist step", parameters=f"{pl},{option}")
-        await self.coordinator.async_request_refresh()
+        self.coordinator.async_request_refresh_background()
 
 
-class BackgroundPlaylistSelect(CoordinatorEntity[XScheduleCoordinator], SelectEntity):
+class BackgroundPlaylistSelect(XScheduleEntity, SelectEntity):
     _attr_has_entity_name = True
     _attr_translation_key = "background_playlist"
     _attr_entity_category = EntityCategory.CONFIG
     _attr_icon = "mdi:playlist-music-outline"
 
-    def __init__(self, hass: HomeAssistant, client: XScheduleClient, coordinator: XScheduleCoordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator)
-        self.hass = hass
-        self._client = client
-        self._entry = entry
-        self._attr_unique_id = f"{entry.data['host']}:{entry.data['port']}:select_background_playlist"
+    def __init__(self, client: XScheduleClient, coordinator: XScheduleCoordinator, entry: ConfigEntry, host_port: str, store: dict[str, Any]) -> None:
+        super().__init__(client, coordinator, entry, host_port)
+        self._store = store
+        self._attr_unique_id = f"{host_port}:select_background_playlist"
+        # (available, current option, playlists) as last written; unchanged ticks skip the write
+        self._written: tuple[bool, str | None, list[str]] | None = None
+        self._attr_options: list[str] = []
         device_slug = slugify_entry_title(entry)
         self.entity_id = f"select.{DOMAIN}_{device_slug}_background_playlist"
 
-    @property
-    def device_info(self):
-        xs_ver = (self.coordinator.data or {}).get("version") if self.coordinator else None
-        return {
-            "identifiers": {(DOMAIN, f"{self._entry.data['host']}:{self._entry.data['port']}")},
-            "name": "xLights Scheduler",
-            "manufacturer": "xLights",
-            "model": "xSchedule",
-            "sw_version": xs_ver or INTEGRATION_VERSION,
-        }
-
-    @property
-    def options(self) -> list[str]:
-        playlists = self.coordinator.data.get("_playlists") if self.coordinator.data else []
-        names = [pl.get("name") for pl in playlists or [] if pl.get("name")]
-        return ["Clear background"] + names
-
-    @property
-    def current_option(self) -> str | None:
-        return self.hass.data[DOMAIN][self._entry.entry_id].get("background_playlist")
+    def _refresh_attrs(self) -> bool:
+        data = self.coordinator.data or {}
+        current = self._store.get("background_playlist")
+        names = self.coordinator.playlist_names
+        if self._written is None or names is not self._written[2]:
+            self._attr_options = ["Clear background", *names]
+        written = (self.available, current, names)
+        if written == self._written:
+            return False
+        self._written = written
+        self._attr_current_option = current
+        return True
 
     async def async_select_option(self, option: str) -> None:
         if option == "Clear background":
             await self._client.command("Clear background playlist")
-            self.hass.data[DOMAIN][self._entry.entry_id]["background_playlist"] = None
+            self._store["background_playlist"] = None
         else:
             await self._client.command("Set playlist as background", parameters=option)
-            self.hass.data[DOMAIN][self._entry.entry_id]["background_playlist"] = option
-        await self.coordinator.async_request_refresh()
+            self._store["background_playlist"] = option
+        if self._refresh_attrs():
+            self.async_write_ha_state()
+        self.coordinator.async_request_refresh_background()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import datetime as dt
 import logging
 from typing import Any
 
@@ -11,67 +12,58 @@ except Exception:  # pragma: no cover - compatibility fallback
     SensorDeviceClass = None  # type: ignore[assignment]
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.util import dt as dt_util
 
 from .client import XScheduleClient
 from .coordinator import XScheduleCoordinator
-from .const import DOMAIN, INTEGRATION_VERSION, slugify_entry_title
+from .entity import XScheduleEntity
+from .const import DOMAIN, slugify_entry_title
 
 _LOGGER = logging.getLogger(__name__)
 
+# Shared placeholder for payloads without a parsed next schedule
+_NO_NEXT_SCHEDULED: tuple[None, None, None, None] = (None, None, None, None)
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
     data = hass.data[DOMAIN][entry.entry_id]
     client: XScheduleClient = data["client"]
     coordinator: XScheduleCoordinator = data["coordinator"]
+    host_port: str = data["host_port"]
 
+    # Entities read coordinator data that is already populated; nothing to update before adding
     async_add_entities(
-        [
-            PlaylistStepCountSensor(hass, client, coordinator, entry),
-            CurrentPlaylistSensor(client, coordinator, entry),
-            CurrentPlaylistStepSensor(client, coordinator, entry),
-            NextScheduledSensor(client, coordinator, entry),
-            NextScheduledMinutesSensor(client, coordinator, entry),
-            NextScheduledPlaylistSensor(client, coordinator, entry),
-            XScheduleVersionSensor(client, coordinator, entry),
-        ]
+        (
+            PlaylistStepCountSensor(client, coordinator, entry, host_port, data),
+            CurrentPlaylistSensor(client, coordinator, entry, host_port),
+            CurrentPlaylistStepSensor(client, coordinator, entry, host_port),
+            NextScheduledSensor(client, coordinator, entry, host_port),
+            NextScheduledMinutesSensor(client, coordinator, entry, host_port),
+            NextScheduledPlaylistSensor(client, coordinator, entry, host_port),
+            XScheduleVersionSensor(client, coordinator, entry, host_port),
+        ),
+        update_before_add=False,
     )
 
 
-class PlaylistStepCountSensor(CoordinatorEntity[XScheduleCoordinator], SensorEntity):
+class PlaylistStepCountSensor(XScheduleEntity, SensorEntity):
     _attr_has_entity_name = True
     _attr_translation_key = "playlist_step_count"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_icon = "mdi:counter"
 
-    def __init__(self, hass: HomeAssistant, client: XScheduleClient, coordinator: XScheduleCoordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator)
-        self.hass = hass
-        self._client = client
-        self._entry = entry
-        self._attr_unique_id = f"{entry.data['host']}:{entry.data['port']}:sensor_playlist_step_count"
+    def __init__(self, client: XScheduleClient, coordinator: XScheduleCoordinator, entry: ConfigEntry, host_port: str, store: dict[str, Any]) -> None:
+        super().__init__(client, coordinator, entry, host_port)
+        self._store = store
+        self._attr_unique_id = f"{host_port}:sensor_playlist_step_count"
         device_slug = slugify_entry_title(entry)
         self.entity_id = f"sensor.{DOMAIN}_{device_slug}_playlist_step_count"
-        self._count: int = 0
-        self._last_playlist: str | None = None
-        self._cache_ts: Any = None
-        self._ttl_secs: int = 15
-
-    @property
-    def device_info(self):
-        xs_ver = (self.coordinator.data or {}).get("version") if self.coordinator else None
-        return {
-            "identifiers": {(DOMAIN, f"{self._entry.data['host']}:{self._entry.data['port']}")},
-            "name": "xLights Scheduler",
-            "manufacturer": "xLights",
-            "model": "xSchedule",
-            "sw_version": xs_ver or INTEGRATION_VERSION,
-        }
 
     def _get_active_playlist(self) -> str | None:
-        sel = self.hass.data[DOMAIN][self._entry.entry_id].get("selected_playlist")
+        sel = self._store.get("selected_playlist")
         if sel:
             return sel
         data = self.coordinator.data or {}
@@ -79,122 +71,71 @@ class PlaylistStepCountSensor(CoordinatorEntity[XScheduleCoordinator], SensorEnt
 
     @property
     def native_value(self):
-        return self._count
-
-    async def async_update(self) -> None:
         pl = self._get_active_playlist()
         if not pl:
-            self._count = 0
-            return
-        steps = await self._client.get_steps(pl)
-        self._count = len([s for s in steps if s.get("name")])
-
-    def _handle_coordinator_update(self) -> None:
-        from homeassistant.util import dt as dt_util  # local import to avoid top-level dependency
+            return 0
+        steps = (self.coordinator.data or {}).get("_steps") or {}
+        return len(steps.get(pl, []))
 
-        pl = self._get_active_playlist()
-        need = False
-        if pl != self._last_playlist:
-            need = True
-        else:
-            if self._cache_ts is None or (dt_util.utcnow() - self._cache_ts).total_seconds() > self._ttl_secs:
-                need = True
-        if need:
-            self._last_playlist = pl
-            self._cache_ts = dt_util.utcnow()
-            self.hass.async_create_task(self.async_update())
-        self.async_write_ha_state()
 
-
-class CurrentPlaylistSensor(CoordinatorEntity[XScheduleCoordinator], SensorEntity):
+class CurrentPlaylistSensor(XScheduleEntity, SensorEntity):
     _attr_has_entity_name = True
     _attr_translation_key = "current_playlist"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_icon = "mdi:playlist-music"
 
-    def __init__(self, client: XScheduleClient, coordinator: XScheduleCoordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator)
-        self._client = client
-        self._entry = entry
-        self._attr_unique_id = f"{entry.data['host']}:{entry.data['port']}:sensor_current_playlist"
+    def __init__(self, client: XScheduleClient, coordinator: XScheduleCoordinator, entry: ConfigEntry, host_port: str) -> None:
+        super().__init__(client, coordinator, entry, host_port)
+        self._attr_unique_id = f"{host_port}:sensor_current_playlist"
         device_slug = slugify_entry_title(entry)
         self.entity_id = f"sensor.{DOMAIN}_{device_slug}_current_playlist"
 
-    @property
-    def device_info(self):
-        xs_ver = (self.coordinator.data or {}).get("version") if self.coordinator else None
-        return {
-            "identifiers": {(DOMAIN, f"{self._entry.data['host']}:{self._entry.data['port']}")},
-            "name": "xLights Scheduler",
-            "manufacturer": "xLights",
-            "model": "xSchedule",
-            "sw_version": xs_ver or INTEGRATION_VERSION,
-        }
-
     @property
     def native_value(self):
         data = self.coordinator.data or {}
         return data.get("playlist") or None
 
 
-class CurrentPlaylistStepSensor(CoordinatorEntity[XScheduleCoordinator], SensorEntity):
+class CurrentPlaylistStepSensor(XScheduleEntity, SensorEntity):
     _attr_has_entity_name = True
     _attr_translation_key = "current_playlist_step"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_icon = "mdi:playlist-play"
 
-    def __init__(self, client: XScheduleClient, coordinator: XScheduleCoordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator)
-        self._client = client
-        self._entry = entry
-        self._attr_unique_id = f"{entry.data['host']}:{entry.data['port']}:sensor_current_playlist_step"
+    def __init__(self, client: XScheduleClient, coordinator: XScheduleCoordinator, entry: ConfigEntry, host_port: str) -> None:
+        super().__init__(client, coordinator, entry, host_port)
+        self._attr_unique_id = f"{host_port}:sensor_current_playlist_step"
+        # (available, step) as last written; unchanged coordinator ticks skip the write
+        self._written: tuple[bool, Any] | None = None
         device_slug = slugify_entry_title(entry)
         self.entity_id = f"sensor.{DOMAIN}_{device_slug}_current_playlist_step"
 
-    @property
-    def device_info(self):
-        xs_ver = (self.coordinator.data or {}).get("version") if self.coordinator else None
-        return {
-            "identifiers": {(DOMAIN, f"{self._entry.data['host']}:{self._entry.data['port']}")},
-            "name": "xLights Scheduler",
-            "manufacturer": "xLights",
-            "model": "xSchedule",
-            "sw_version": xs_ver or INTEGRATION_VERSION,
-        }
-
-    @property
-    def native_value(self):
+    def _refresh_attrs(self) -> bool:
         data = self.coordinator.data or {}
-        return data.get("step") or None
+        written = (self.available, data.get("step") or None)
+        if written == self._written:
+            return False
+        self._written = written
+        self._attr_native_value = written[1]
+        return True
 
 
-class NextScheduledSensor(CoordinatorEntity[XScheduleCoordinator], SensorEntity):
+class NextScheduledSensor(XScheduleEntity, SensorEntity):
     _attr_has_entity_name = True
     _attr_translation_key = "next_scheduled_start"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
 
-    def __init__(self, client: XScheduleClient, coordinator: XScheduleCoordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator)
-        self._client = client
-        self._entry = entry
-        self._attr_unique_id = f"{entry.data['host']}:{entry.data['port']}:sensor_next_scheduled"
+    def __init__(self, client: XScheduleClient, coordinator: XScheduleCoordinator, entry: ConfigEntry, host_port: str) -> None:
+        super().__init__(client, coordinator, entry, host_port)
+        self._attr_unique_id = f"{host_port}:sensor_next_scheduled"
         self._attr_icon = "mdi:calendar-clock"
         self._state: Any = None
         self._attrs: dict[str, Any] = {}
+        # (available, parsed next schedule) as last written
+        self._written: tuple | None = None
         device_slug = slugify_entry_title(entry)
         self.entity_id = f"sensor.{DOMAIN}_{device_slug}_next_scheduled_start"
 
-    @property
-    def device_info(self):
-        xs_ver = (self.coordinator.data or {}).get("version") if self.coordinator else None
-        return {
-            "identifiers": {(DOMAIN, f"{self._entry.data['host']}:{self._entry.data['port']}")},
-            "name": "xLights Scheduler",
-            "manufacturer": "xLights",
-            "model": "xSchedule",
-            "sw_version": xs_ver or INTEGRATION_VERSION,
-        }
-
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         return self._attrs
@@ -203,12 +144,14 @@ class NextScheduledSensor(CoordinatorEntity[XScheduleCoordinator], SensorEntity)
     def native_value(self):
         return self._state
 
-    def _handle_coordinator_update(self) -> None:
-        js = (self.coordinator.data or {}).get("_next_scheduled") or {}
-        start = js.get("start")
-        end = js.get("end")
-        playlistname = js.get("playlistname")
-        schedulename = js.get("schedulename")
+    def _refresh_attrs(self) -> bool:
+        data = self.coordinator.data
+        parsed = data.get("_next_scheduled_parsed", _NO_NEXT_SCHEDULED) if data else _NO_NEXT_SCHEDULED
+        written = (self.available, parsed)
+        if written == self._written:
+            return False
+        self._written = written
+        start, end, playlistname, schedulename = parsed
 
         self._state = start
         self._attrs = {
@@ -216,44 +159,42 @@ class NextScheduledSensor(CoordinatorEntity[XScheduleCoordinator], SensorEntity)
             "schedule": schedulename,
             "end": end,
         }
-        self.async_write_ha_state()
+        return True
 
 
-class NextScheduledMinutesSensor(CoordinatorEntity[XScheduleCoordinator], SensorEntity):
+class NextScheduledMinutesSensor(XScheduleEntity, SensorEntity):
     _attr_has_entity_name = True
     _attr_translation_key = "next_scheduled_start_minutes"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_icon = "mdi:timer-sand"
 
-    def __init__(self, client: XScheduleClient, coordinator: XScheduleCoordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator)
-        self._client = client
-        self._entry = entry
-        self._attr_unique_id = f"{entry.data['host']}:{entry.data['port']}:sensor_next_scheduled_minutes"
+    def __init__(self, client: XScheduleClient, coordinator: XScheduleCoordinator, entry: ConfigEntry, host_port: str) -> None:
+        super().__init__(client, coordinator, entry, host_port)
+        self._attr_unique_id = f"{host_port}:sensor_next_scheduled_minutes"
         self._state: Any = None
+        # (available, minutes) as last written
+        self._written: tuple[bool, Any] | None = None
         device_slug = slugify_entry_title(entry)
         self.entity_id = f"sensor.{DOMAIN}_{device_slug}_next_scheduled_start_minutes"
 
-    @property
-    def device_info(self):
-        xs_ver = (self.coordinator.data or {}).get("version") if self.coordinator else None
-        return {
-            "identifiers": {(DOMAIN, f"{self._entry.data['host']}:{self._entry.data['port']}")},
-            "name": "xLights Scheduler",
-            "manufacturer": "xLights",
-            "model": "xSchedule",
-            "sw_version": xs_ver or INTEGRATION_VERSION,
-        }
-
     @property
     def native_value(self):
         return self._state
 
-    def _handle_coordinator_update(self) -> None:
-        from homeassistant.util import dt as dt_util
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        # The coordinator skips unchanged payloads, so tick the countdown ourselves
+        self.async_on_remove(
+            async_track_time_interval(self.hass, self._async_tick, dt.timedelta(minutes=1))
+        )
 
-        js = (self.coordinator.data or {}).get("_next_scheduled") or {}
-        start = js.get("start")
+    @callback
+    def _async_tick(self, _now: dt.datetime) -> None:
+        self._handle_coordinator_update()
+
+    def _refresh_attrs(self) -> bool:
+        data = self.coordinator.data
+        start = data.get("_next_scheduled_parsed", _NO_NEXT_SCHEDULED)[0] if data else None
 
         if not start:
             self._state = None
@@ -270,36 +211,30 @@ class NextScheduledMinutesSensor(CoordinatorEntity[XScheduleCoordinator], Sensor
             except Exception:
                 self._state = None
 
-        self.async_write_ha_state()
+        # Coordinator updates between minute ticks usually leave the countdown where it was
+        written = (self.available, self._state)
+        if written == self._written:
+            return False
+        self._written = written
+        return True
 
 
-class NextScheduledPlaylistSensor(CoordinatorEntity[XScheduleCoordinator], SensorEntity):
+class NextScheduledPlaylistSensor(XScheduleEntity, SensorEntity):
     _attr_has_entity_name = True
     _attr_translation_key = "next_scheduled_playlist"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_icon = "mdi:playlist-music"
 
-    def __init__(self, client: XScheduleClient, coordinator: XScheduleCoordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator)
-        self._client = client
-        self._entry = entry
-        self._attr_unique_id = f"{entry.data['host']}:{entry.data['port']}:sensor_next_scheduled_playlist"
+    def __init__(self, client: XScheduleClient, coordinator: XScheduleCoordinator, entry: ConfigEntry, host_port: str) -> None:
+        super().__init__(client, coordinator, entry, host_port)
+        self._attr_unique_id = f"{host_port}:sensor_next_scheduled_playlist"
         self._state: Any = None
         self._attrs: dict[str, Any] = {}
+        # (available, parsed next schedule) as last written
+        self._written: tuple | None = None
         device_slug = slugify_entry_title(entry)
         self.entity_id = f"sensor.{DOMAIN}_{device_slug}_next_scheduled_playlist"
 
-    @property
-    def device_info(self):
-        xs_ver = (self.coordinator.data or {}).get("version") if self.coordinator else None
-        return {
-            "identifiers": {(DOMAIN, f"{self._entry.data['host']}:{self._entry.data['port']}")},
-            "name": "xLights Scheduler",
-            "manufacturer": "xLights",
-            "model": "xSchedule",
-            "sw_version": xs_ver or INTEGRATION_VERSION,
-        }
-
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         return self._attrs
@@ -308,12 +243,14 @@ class NextScheduledPlaylistSensor(CoordinatorEntity[XScheduleCoordinator], Senso
     def native_value(self):
         return self._state
 
-    def _handle_coordinator_update(self) -> None:
-        js = (self.coordinator.data or {}).get("_next_scheduled") or {}
-        playlistname = js.get("playlistname")
-        schedulename = js.get("schedulename")
-        start = js.get("start")
-        end = js.get("end")
+    def _refresh_attrs(self) -> bool:
+        data = self.coordinator.data
+        parsed = data.get("_next_scheduled_parsed", _NO_NEXT_SCHEDULED) if data else _NO_NEXT_SCHEDULED
+        written = (self.available, parsed)
+        if written == self._written:
+            return False
+        self._written = written
+        start, end, playlistname, schedulename = parsed
 
         self._state = playlistname
         self._attrs = {
@@ -321,10 +258,10 @@ class NextScheduledPlaylistSensor(CoordinatorEntity[XScheduleCoordinator], Senso
             "start": start,
             "end": end,
         }
-        self.async_write_ha_state()
+        return True
 
 
-class XScheduleVersionSensor(CoordinatorEntity[XScheduleCoordinator], SensorEntity):
+class XScheduleVersionSensor(XScheduleEntity, SensorEntity):
     _attr_has_entity_name = True
     _attr_translation_key = "xschedule_version"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
@@ -333,26 +270,13 @@ class XScheduleVersionSensor(CoordinatorEntity[XScheduleCoordinator], SensorEnti
     if SensorDeviceClass is not None and hasattr(SensorDeviceClass, "VERSION"):
         _attr_device_class = SensorDeviceClass.VERSION
 
-    def __init__(self, client: XScheduleClient, coordinator: XScheduleCoordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator)
-        self._client = client
-        self._entry = entry
-        self._attr_unique_id = f"{entry.data['host']}:{entry.data['port']}:sensor_xschedule_version"
+    def __init__(self, client: XScheduleClient, coordinator: XScheduleCoordinator, entry: ConfigEntry, host_port: str) -> None:
+        super().__init__(client, coordinator, entry, host_port)
+        self._attr_unique_id = f"{host_port}:sensor_xschedule_version"
         self._attr_icon = "mdi:information-outline"
         device_slug = slugify_entry_title(entry)
         self.entity_id = f"sensor.{DOMAIN}_{device_slug}_xschedule_version"
 
-    @property
-    def device_info(self):
-        xs_ver = (self.coordinator.data or {}).get("version") if self.coordinator else None
-        return {
-            "identifiers": {(DOMAIN, f"{self._entry.data['host']}:{self._entry.data['port']}")},
-            "name": "xLights Scheduler",
-            "manufacturer": "xLights",
-            "model": "xSchedule",
-            "sw_version": xs_ver or INTEGRATION_VERSION,
-        }
-
     @property
     def native_value(self):
         return (self.coordinator.data or {}).get("version") or "Unknown"
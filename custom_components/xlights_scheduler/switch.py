@@ -6,15 +6,14 @@ from typing import Any
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .client import XScheduleClient
 from .coordinator import XScheduleCoordinator
+from .entity import XScheduleEntity
 from .const import (
     DOMAIN,
-    INTEGRATION_VERSION,
     EVENT_TEST_MODE_STARTED,
     EVENT_TEST_MODE_STOPPED,
     slugify_entry_title,
@@ -27,131 +26,117 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     data = hass.data[DOMAIN][entry.entry_id]
     client: XScheduleClient = data["client"]
     coordinator: XScheduleCoordinator = data["coordinator"]
+    host_port: str = data["host_port"]
 
+    # Entities read coordinator data that is already populated; nothing to update before adding
     async_add_entities(
-        [
-            OutputToLightsSwitch(client, coordinator, entry),
-            PlaylistLoopSwitch(client, coordinator, entry),
-            TestModeSwitch(client, coordinator, entry),
-        ]
+        (
+            OutputToLightsSwitch(client, coordinator, entry, host_port),
+            PlaylistLoopSwitch(client, coordinator, entry, host_port),
+            TestModeSwitch(client, coordinator, entry, host_port, data),
+        ),
+        update_before_add=False,
     )
 
 
-class OutputToLightsSwitch(CoordinatorEntity[XScheduleCoordinator], SwitchEntity):
-    _attr_has_entity_name = True
-    _attr_translation_key = "output_to_lights"
-    _attr_icon = "mdi:lightbulb-on"
+class BaseXScheduleToggleSwitch(XScheduleEntity, SwitchEntity):
+    # Coordinator key holding the device's current on/off state
+    _status_key: str
 
-    def __init__(self, client: XScheduleClient, coordinator: XScheduleCoordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator)
-        self._client = client
-        self._entry = entry
-        self._attr_unique_id = f"{entry.data['host']}:{entry.data['port']}:switch_output_to_lights"
-        device_slug = slugify_entry_title(entry)
-        self.entity_id = f"switch.{DOMAIN}_{device_slug}_output_to_lights"
-    
-    @property
-    def device_info(self):
-        xs_ver = (self.coordinator.data or {}).get("version") if self.coordinator else None
-        return {
-            "identifiers": {(DOMAIN, f"{self._entry.data['host']}:{self._entry.data['port']}")},
-            "name": "xLights Scheduler",
-            "manufacturer": "xLights",
-            "model": "xSchedule",
-            "sw_version": xs_ver or INTEGRATION_VERSION,
-        }
+    def __init__(self, client: XScheduleClient, coordinator: XScheduleCoordinator, entry: ConfigEntry, host_port: str) -> None:
+        super().__init__(client, coordinator, entry, host_port)
+        # (available, is_on) as last written; coordinator ticks that leave it unchanged skip the write
+        self._written: tuple[bool, bool] | None = None
 
-    @property
-    def is_on(self) -> bool:
+    def _refresh_attrs(self) -> bool:
         data = self.coordinator.data or {}
-        return (data.get("outputtolights") or "false") == "true"
+        written = (self.available, bool(data.get(self._status_key)))
+        if written == self._written:
+            return False
+        self._written = written
+        self._attr_is_on = written[1]
+        return True
+
+    @callback
+    def _set_optimistic(self, is_on: bool) -> None:
+        # The device only toggles, so later calls must see the new state before the poll confirms it
+        self._written = (self.available, is_on)
+        self._attr_is_on = is_on
+        self.async_write_ha_state()
+
+    async def _async_toggle(self) -> None:
+        raise NotImplementedError
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         if not self.is_on:
-            await self._client.toggle_output_to_lights()
+            await self._async_toggle()
+            self._set_optimistic(True)
             await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         if self.is_on:
-            await self._client.toggle_output_to_lights()
+            await self._async_toggle()
+            self._set_optimistic(False)
             await self.coordinator.async_request_refresh()
 
 
-class PlaylistLoopSwitch(CoordinatorEntity[XScheduleCoordinator], SwitchEntity):
+class OutputToLightsSwitch(BaseXScheduleToggleSwitch):
+    _attr_has_entity_name = True
+    _attr_translation_key = "output_to_lights"
+    _attr_icon = "mdi:lightbulb-on"
+    _status_key = "outputtolights_bool"
+
+    def __init__(self, client: XScheduleClient, coordinator: XScheduleCoordinator, entry: ConfigEntry, host_port: str) -> None:
+        super().__init__(client, coordinator, entry, host_port)
+        self._attr_unique_id = f"{host_port}:switch_output_to_lights"
+        device_slug = slugify_entry_title(entry)
+        self.entity_id = f"switch.{DOMAIN}_{device_slug}_output_to_lights"
+
+    async def _async_toggle(self) -> None:
+        await self._client.toggle_output_to_lights()
+
+
+class PlaylistLoopSwitch(BaseXScheduleToggleSwitch):
     _attr_has_entity_name = True
     _attr_translation_key = "playlist_loop"
     _attr_icon = "mdi:repeat"
+    _status_key = "playlistlooping_bool"
 
-    def __init__(self, client: XScheduleClient, coordinator: XScheduleCoordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator)
-        self._client = client
-        self._entry = entry
-        self._attr_unique_id = f"{entry.data['host']}:{entry.data['port']}:switch_playlist_loop"
+    def __init__(self, client: XScheduleClient, coordinator: XScheduleCoordinator, entry: ConfigEntry, host_port: str) -> None:
+        super().__init__(client, coordinator, entry, host_port)
+        self._attr_unique_id = f"{host_port}:switch_playlist_loop"
         device_slug = slugify_entry_title(entry)
         self.entity_id = f"switch.{DOMAIN}_{device_slug}_playlist_loop"
     
-    @property
-    def device_info(self):
-        xs_ver = (self.coordinator.data or {}).get("version") if self.coordinator else None
-        return {
-            "identifiers": {(DOMAIN, f"{self._entry.data['host']}:{self._entry.data['port']}")},
-            "name": "xLights Scheduler",
-            "manufacturer": "xLights",
-            "model": "xSchedule",
-            "sw_version": xs_ver or INTEGRATION_VERSION,
-        }
-
     @property
     def available(self) -> bool:
         # Expose the playlist loop control even when idle so users
         # can preconfigure loop state for the next playback.
         return True
 
-    @property
-    def is_on(self) -> bool:
-        data = self.coordinator.data or {}
-        return (data.get("playlistlooping") or "false") == "true"
-
-    async def async_turn_on(self, **kwargs: Any) -> None:
-        if not self.is_on:
-            await self._client.toggle_playlist_loop()
-            await self.coordinator.async_request_refresh()
-
-    async def async_turn_off(self, **kwargs: Any) -> None:
-        if self.is_on:
-            await self._client.toggle_playlist_loop()
-            await self.coordinator.async_request_refresh()
+    async def _async_toggle(self) -> None:
+        await self._client.toggle_playlist_loop()
 
 
-class TestModeSwitch(CoordinatorEntity[XScheduleCoordinator], SwitchEntity):
+class TestModeSwitch(XScheduleEntity, SwitchEntity):
     _attr_has_entity_name = True
     _attr_translation_key = "test_mode"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_icon = "mdi:test-tube"
 
-    def __init__(self, client: XScheduleClient, coordinator: XScheduleCoordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator)
-        self._client = client
-        self._entry = entry
-        self._attr_unique_id = f"{entry.data['host']}:{entry.data['port']}:switch_test_mode"
+    def __init__(self, client: XScheduleClient, coordinator: XScheduleCoordinator, entry: ConfigEntry, host_port: str, store: dict[str, Any]) -> None:
+        super().__init__(client, coordinator, entry, host_port)
+        self._store = store
+        self._attr_unique_id = f"{host_port}:switch_test_mode"
+        # Event payload parts are fixed per entry
+        self._evt_device_field = f"{DOMAIN}:{self._host_port}"
         device_slug = slugify_entry_title(entry)
         self.entity_id = f"switch.{DOMAIN}_{device_slug}_test_mode"
 
-    @property
-    def device_info(self):
-        xs_ver = (self.coordinator.data or {}).get("version") if self.coordinator else None
-        return {
-            "identifiers": {(DOMAIN, f"{self._entry.data['host']}:{self._entry.data['port']}")},
-            "name": "xLights Scheduler",
-            "manufacturer": "xLights",
-            "model": "xSchedule",
-            "sw_version": xs_ver or INTEGRATION_VERSION,
-        }
-
     @property
     def is_on(self) -> bool:
         # Optimistic: remember last requested state
-        return bool(self.hass.data[DOMAIN][self._entry.entry_id].get("test_mode", False))
+        return bool(self._store.get("test_mode", False))
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         # xSchedule requires at least one parameter: test mode name
@@ -159,24 +144,18 @@ class TestModeSwitch(CoordinatorEntity[XScheduleCoordinator], SwitchEntity):
         mode = "Alternate"
         res = await self._client.command("Start test mode", parameters=mode)
         if res.get("result") == "ok":
-            self.hass.data[DOMAIN][self._entry.entry_id]["test_mode"] = True
+            self._store["test_mode"] = True
+            self.async_write_ha_state()
             self.hass.bus.async_fire(
                 EVENT_TEST_MODE_STARTED,
-                {
-                    "mode": mode,
-                    "device": f"{DOMAIN}:{self._entry.data['host']}:{self._entry.data['port']}",
-                },
+                {"mode": mode, "device": self._evt_device_field},
             )
-            await self.coordinator.async_request_refresh()
+            self.coordinator.async_request_refresh_background()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         res = await self._client.command("Stop test mode")
         if res.get("result") == "ok":
-            self.hass.data[DOMAIN][self._entry.entry_id]["test_mode"] = False
-            self.hass.bus.async_fire(
-                EVENT_TEST_MODE_STOPPED,
-                {
-                    "device": f"{DOMAIN}:{self._entry.data['host']}:{self._entry.data['port']}",
-                },
-            )
-            await self.coordinator.async_request_refresh()
+            self._store["test_mode"] = False
+            self.async_write_ha_state()
+            self.hass.bus.async_fire(EVENT_TEST_MODE_STOPPED, {"device": self._evt_device_field})
+            self.coordinator.async_request_refresh_background()